@@ -0,0 +1,44 @@
+"""Shared thread pool for scanning several watch directories at once."""
+
+from __future__ import annotations
+
+import functools
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterable, Iterator, Sequence
+    from pathlib import Path
+
+# Upper bound on threads used to scan watch directories concurrently
+MAX_SCAN_WORKERS = 8
+
+
+@functools.cache
+def _scan_executor() -> ThreadPoolExecutor:
+    """Return the process-wide scan pool, created on first use.
+
+    The daemon scans every cycle; reusing one pool keeps thread start-up off
+    that path. Workers are spawned on demand and joined at interpreter exit.
+    """
+    return ThreadPoolExecutor(max_workers=MAX_SCAN_WORKERS, thread_name_prefix="scan")
+
+
+def scan_directories[T](scan: Callable[[Path], Iterable[T]], directories: Sequence[Path]) -> Iterator[T]:
+    """Run ``scan`` over each directory, in worker threads when there are several.
+
+    Directory walking is dominated by readdir/stat syscalls that release the
+    GIL, so a slow (e.g. iCloud-evicted) directory no longer delays the rest.
+    A single directory is scanned lazily in the calling thread. Results are
+    yielded in directory order either way. Workers come from a shared pool,
+    so ``scan`` must not itself fan out through this helper.
+    """
+    if len(directories) <= 1:
+        for directory in directories:
+            yield from scan(directory)
+        return
+
+    per_directory = list(_scan_executor().map(lambda directory: list(scan(directory)), directories))
+
+    for results in per_directory:
+        yield from results
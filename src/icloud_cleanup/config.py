@@ -9,6 +9,9 @@ from typing import Any
 
 import yaml
 
+# "filename 2.ext", "filename 3.ext", ... (iCloud conflict numbers start at 2)
+DEFAULT_CONFLICT_PATTERN = r"^(.+)\s+([2-9]|\d{2,})(\.[^.]+)?$"
+
 
 def parse_bool(value: Any, default: bool) -> bool:
     """Coerce YAML string representations ('true', 'yes', 'on', '1') to bool."""
@@ -31,7 +34,7 @@ class CleanupConfig:
     # File patterns to match as conflicts (regex)
     # Default: matches "filename 2.ext", "filename 3.ext", etc.
     # iCloud conflict numbers start at 2, not 1
-    conflict_pattern: str = r"^(.+)\s+([2-9]|\d{2,})(\.[^.]+)?$"
+    conflict_pattern: str = DEFAULT_CONFLICT_PATTERN
 
     # Wait time before deleting (seconds) - allows iCloud to finish syncing
     wait_before_delete: int = 180  # 3 minutes
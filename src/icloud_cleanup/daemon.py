@@ -18,15 +18,22 @@ from rich.logging import RichHandler
 from .cleaner import Cleaner, CleanupResult
 from .detector import ConflictDetector, ConflictFile
 from .icloud_status import ICloudStatusChecker
-from .modules import discover_modules
+from .modules import discover_modules, scan_all_modules
 from .nosync import NOSYNC_SUFFIX, NosyncManager
 from .watcher import FileWatcher
 
 if TYPE_CHECKING:
+    from collections.abc import Callable
+
     from .config import CleanupConfig
     from .modules.base import CleanupModule, DetectedFile
 
 
+def _loop_time() -> float:
+    """Return the monotonic time of the running event loop."""
+    return asyncio.get_running_loop().time()
+
+
 @dataclass
 class DaemonStats:
     """Runtime counters for a single daemon session."""
@@ -70,6 +77,8 @@ class ICloudCleanupDaemon:
         self._watch_modules = [m for m in self.modules if m.supports_watch]
         self._pending_deletes: dict[Path, tuple[float, DetectedFile | None]] = {}
         self._failed_deletes: dict[Path, tuple[int, float]] = {}  # (count, timestamp)
+        # Time source for pending/cooldown bookkeeping; tests may swap in a frozen clock
+        self._clock: Callable[[], float] = _loop_time
 
     def _setup_logging(self) -> logging.Logger:
         logger = logging.getLogger("icloud-cleanup")
@@ -105,7 +114,7 @@ class ICloudCleanupDaemon:
     async def _process_detected(self, detected: DetectedFile) -> CleanupResult | None:
         """Wait for iCloud sync (if needed), then delete a detected file."""
         path = detected.path
-        current_time = asyncio.get_running_loop().time()
+        current_time = self._clock()
 
         should_skip, failure_count = self._check_cooldown_status(path, current_time)
         if should_skip:
@@ -136,7 +145,7 @@ class ICloudCleanupDaemon:
     async def _process_conflict(self, conflict: ConflictFile) -> CleanupResult | None:
         """Backward-compat wrapper: wait for iCloud sync, then delete a conflict."""
         path = conflict.path
-        current_time = asyncio.get_running_loop().time()
+        current_time = self._clock()
 
         # Check cooldown status
         should_skip, failure_count = self._check_cooldown_status(path, current_time)
@@ -233,7 +242,7 @@ class ICloudCleanupDaemon:
 
     async def _process_pending_deletes(self) -> None:
         """Process files that have been pending long enough."""
-        current_time = asyncio.get_running_loop().time()
+        current_time = self._clock()
 
         ready: list[tuple[Path, DetectedFile | None]] = []
         for path, (timestamp, detected) in self._pending_deletes.items():
@@ -291,7 +300,7 @@ class ICloudCleanupDaemon:
 
     def _scan_and_queue(self) -> None:
         """Scan all directories using all modules and queue files for deletion."""
-        current_time = asyncio.get_running_loop().time()
+        current_time = self._clock()
 
         # Symlink guardian: run every Nth cycle to reduce IO
         run_guardian = (
@@ -303,28 +312,25 @@ class ICloudCleanupDaemon:
             for directory in self.config.watch_directories:
                 self._run_symlink_guardian(directory)
 
-        # Scan via all modules
-        for module in self.modules:
-            for detected in module.scan_all():
-                if detected.path not in self._pending_deletes:
-                    self._pending_deletes[detected.path] = (current_time, detected)
-                    self.stats.files_detected += 1
-                    self.logger.info(
-                        "Queued [%s]: %s — %s",
-                        detected.module_name,
-                        detected.path.name,
-                        detected.reason,
-                    )
+        # Scan via all modules, sharing one walk per watch directory
+        for detected in scan_all_modules(self.modules, self.config.watch_directories):
+            if detected.path not in self._pending_deletes:
+                self._pending_deletes[detected.path] = (current_time, detected)
+                self.stats.files_detected += 1
+                self.logger.info(
+                    "Queued [%s]: %s — %s",
+                    detected.module_name,
+                    detected.path.name,
+                    detected.reason,
+                )
 
     async def run_once(self) -> list[CleanupResult]:
         """Run a single cleanup pass across all modules."""
         self.logger.info("Starting single cleanup pass...")
         results: list[CleanupResult] = []
 
-        # Scan via all modules
-        all_detected: list[DetectedFile] = []
-        for module in self.modules:
-            all_detected.extend(module.scan_all())
+        # Scan via all modules, sharing one walk per watch directory
+        all_detected = scan_all_modules(self.modules, self.config.watch_directories)
 
         self.logger.info("Found %d files to process across %d modules", len(all_detected), len(self.modules))
 
@@ -366,7 +372,7 @@ class ICloudCleanupDaemon:
                 raise
             if detected:
                 self._pending_deletes[path] = (
-                    asyncio.get_running_loop().time(),
+                    self._clock(),
                     detected,
                 )
                 self.stats.files_detected += 1
@@ -397,7 +403,7 @@ class ICloudCleanupDaemon:
         self._scan_and_queue()
 
         try:
-            last_scan = loop.time()
+            last_scan = self._clock()
 
             while self._running:
                 raw_paths = self.watcher.drain_paths()
@@ -406,10 +412,10 @@ class ICloudCleanupDaemon:
 
                 await self._process_pending_deletes()
 
-                if loop.time() - last_scan >= self.config.scan_interval:
+                if self._clock() - last_scan >= self.config.scan_interval:
                     self._scan_and_queue()
                     self.cleaner.cleanup_recovery_dir()
-                    last_scan = loop.time()
+                    last_scan = self._clock()
 
                 await asyncio.sleep(self.config.watcher_drain_interval)
 
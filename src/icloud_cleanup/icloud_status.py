@@ -4,6 +4,8 @@ from __future__ import annotations
 
 import asyncio
 import logging
+import random
+import re
 import subprocess
 from dataclasses import dataclass
 from enum import Enum
@@ -14,6 +16,15 @@ if TYPE_CHECKING:
     from .config import CleanupConfig
 
 SUBPROCESS_TIMEOUT_SECONDS = 10
+INITIAL_POLL_DELAY = 0.1  # First wait_for_sync backoff step (seconds)
+
+# Every pending-transfer attribute in one pattern so xattr output is scanned
+# in a single pass; group 1 is the transfer direction
+_PENDING_XATTR_PATTERN = re.compile(rb"com\.apple\.icloud\.item(Upload|Download)Pending")
+
+# One "key: value" pair per brctl status line; split on the first colon with
+# surrounding whitespace trimmed
+_BRCTL_LINE = re.compile(r"^[ \t]*([^:\n]*?)[ \t]*:[ \t]*(.*?)[ \t\r]*$", re.MULTILINE)
 
 logger = logging.getLogger(__name__)
 
@@ -29,7 +40,7 @@ class SyncStatus(Enum):
     UNKNOWN = "unknown"
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class FileStatus:
     """Snapshot of a file's sync state, placeholder presence, and upload status."""
 
@@ -39,6 +50,65 @@ class FileStatus:
     is_uploaded: bool
 
 
+def _is_placeholder_name(name: str) -> bool:
+    """Check for an evicted-file stub name like ``.document.txt.icloud``."""
+    return name.startswith(".") and name.endswith(".icloud")
+
+
+def _unknown_status(path: Path) -> FileStatus:
+    """Build the status reported when xattr cannot be read."""
+    return FileStatus(
+        path=path,
+        status=SyncStatus.UNKNOWN,
+        is_placeholder=False,
+        is_uploaded=False,
+    )
+
+
+def _status_from_flags(path: Path, *, is_uploading: bool, is_placeholder: bool) -> FileStatus:
+    """Map pending upload/download attribute presence to a FileStatus."""
+    if is_uploading:
+        sync_status = SyncStatus.UPLOADING
+    elif is_placeholder:
+        sync_status = SyncStatus.DOWNLOADING
+    else:
+        sync_status = SyncStatus.SYNCED
+
+    return FileStatus(
+        path=path,
+        status=sync_status,
+        is_placeholder=is_placeholder,
+        is_uploaded=not is_uploading,
+    )
+
+
+def _read_xattr_status(path: Path) -> FileStatus:
+    """Run ``xattr -l`` on a file and classify it."""
+    try:
+        # Note: Don't use text=True because xattr output may contain
+        # binary data that isn't valid UTF-8
+        result = subprocess.run(
+            ["xattr", "-l", str(path)],
+            capture_output=True,
+            check=False,
+            timeout=SUBPROCESS_TIMEOUT_SECONDS,
+        )
+    except subprocess.TimeoutExpired:
+        logger.debug("xattr timed out for: %s", path)
+        return _unknown_status(path)
+    except (subprocess.SubprocessError, OSError):
+        logger.debug("Failed to read xattr for: %s", path, exc_info=True)
+        return _unknown_status(path)
+
+    # Scan the raw bytes once; decoding would only copy the dump
+    directions = {match.group(1) for match in _PENDING_XATTR_PATTERN.finditer(result.stdout)}
+    return _status_from_flags(
+        path,
+        is_uploading=b"Upload" in directions,
+        is_placeholder=b"Download" in directions,
+    )
+
+
 class ICloudStatusChecker:
     """Check iCloud sync status for files."""
 
@@ -49,86 +119,51 @@ class ICloudStatusChecker:
     def get_file_status(path: Path) -> FileStatus:
         """Inspect xattr to determine whether a file is synced, uploading, or downloading."""
         if not path.exists():
-            return FileStatus(
-                path=path,
-                status=SyncStatus.UNKNOWN,
-                is_placeholder=False,
-                is_uploaded=False,
-            )
-
-        try:
-            # Check for iCloud placeholder (.icloud file)
-            if path.name.startswith(".") and path.name.endswith(".icloud"):
-                return FileStatus(
-                    path=path,
-                    status=SyncStatus.DOWNLOADING,
-                    is_placeholder=True,
-                    is_uploaded=True,
-                )
-
-            # Note: Don't use text=True because xattr output may contain
-            # binary data that isn't valid UTF-8
-            result = subprocess.run(
-                ["xattr", "-l", str(path)],
-                capture_output=True,
-                check=False,
-                timeout=SUBPROCESS_TIMEOUT_SECONDS,
-            )
-
-            xattrs = result.stdout.decode("utf-8", errors="replace")
-
-            is_placeholder = "com.apple.icloud.itemDownloadPending" in xattrs
-            is_uploading = "com.apple.icloud.itemUploadPending" in xattrs
-
-            if is_uploading:
-                sync_status = SyncStatus.UPLOADING
-            elif is_placeholder:
-                sync_status = SyncStatus.DOWNLOADING
-            else:
-                sync_status = SyncStatus.SYNCED
+            return _unknown_status(path)
 
+        # Check for iCloud placeholder (.icloud file)
+        if _is_placeholder_name(path.name):
             return FileStatus(
                 path=path,
-                status=sync_status,
-                is_placeholder=is_placeholder,
-                is_uploaded=not is_uploading,
+                status=SyncStatus.DOWNLOADING,
+                is_placeholder=True,
+                is_uploaded=True,
             )
 
-        except subprocess.TimeoutExpired:
-            logger.debug("xattr timed out for: %s", path)
-            return FileStatus(
-                path=path,
-                status=SyncStatus.UNKNOWN,
-                is_placeholder=False,
-                is_uploaded=False,
-            )
-        except (subprocess.SubprocessError, OSError):
-            logger.debug("Failed to read xattr for: %s", path, exc_info=True)
-            return FileStatus(
-                path=path,
-                status=SyncStatus.UNKNOWN,
-                is_placeholder=False,
-                is_uploaded=False,
-            )
+        return _read_xattr_status(path)
 
     def is_synced(self, path: Path) -> bool:
         """Return True when no pending iCloud upload or download attributes are present."""
-        file_status = self.get_file_status(path)
-        return file_status.status == SyncStatus.SYNCED
+        # Placeholders are never synced; decided from the name before any syscall
+        if _is_placeholder_name(path.name):
+            return False
+        return self.get_file_status(path).status == SyncStatus.SYNCED
 
     async def wait_for_sync(self, path: Path) -> bool:
-        """Poll xattr until iCloud sync completes or timeout is reached."""
-        elapsed = 0
+        """Poll xattr with jittered exponential backoff until sync completes or timeout is reached.
+
+        The delay starts at ``INITIAL_POLL_DELAY`` and doubles up to
+        ``icloud_poll_interval``, so quickly syncing files are released in
+        well under a second while slow ones are polled at the configured rate.
+        Only the ramp-up steps are jittered, so once capped the average poll
+        matches ``icloud_poll_interval``.
+        """
+        elapsed = 0.0
+        delay = INITIAL_POLL_DELAY
         # Ensure minimum poll interval to prevent infinite loop
-        poll_interval = max(self.config.icloud_poll_interval, 1)
+        max_delay = max(self.config.icloud_poll_interval, 1)
 
         while elapsed < self.config.max_icloud_wait:
             synced = await asyncio.to_thread(self.is_synced, path)
             if synced:
                 return True
 
-            await asyncio.sleep(poll_interval)
-            elapsed += poll_interval
+            # Jitter spreads out polls for files queued in the same burst
+            step = random.uniform(delay / 2, delay) if delay < max_delay else delay
+            sleep_for = min(step, self.config.max_icloud_wait - elapsed)
+            await asyncio.sleep(sleep_for)
+            elapsed += sleep_for
+            delay = min(delay * 2, max_delay)
 
         return False
 
@@ -144,14 +179,7 @@ class ICloudStatusChecker:
                 timeout=SUBPROCESS_TIMEOUT_SECONDS,
             )
 
-            status_info: dict[str, str] = {}
-
-            for line in result.stdout.split("\n"):
-                if ":" in line:
-                    key, _, value = line.partition(":")
-                    status_info[key.strip()] = value.strip()
-
-            return status_info
+            return dict(_BRCTL_LINE.findall(result.stdout))
 
         except subprocess.TimeoutExpired:
             logger.debug("brctl status timed out")
@@ -164,7 +192,4 @@ class ICloudStatusChecker:
         """Return True when brctl reports no active uploads or downloads."""
         drive_status = self.get_icloud_drive_status()
         drive_status_text = str(drive_status).lower()
-        return (
-            "uploading" not in drive_status_text
-            and "downloading" not in drive_status_text
-        )
+        return "uploading" not in drive_status_text and "downloading" not in drive_status_text
@@ -18,7 +18,6 @@ from .daemon import ICloudCleanupDaemon
 
 if TYPE_CHECKING:
     from .cleaner import Cleaner
-    from .modules.base import DetectedFile
     from .nosync import NosyncManager
 
 
@@ -133,17 +132,13 @@ def parse_args() -> argparse.Namespace:
 
 def cmd_scan(config: CleanupConfig, args: argparse.Namespace) -> int:  # NOSONAR
     """Scan for cleanup candidates and display results as a table."""
-    from .modules import discover_modules
+    from .modules import discover_modules, scan_all_modules
 
     console = Console()
     modules = discover_modules(config)
 
-    all_detected: list[DetectedFile] = []
-    for module in modules:
-        if args.dir:
-            all_detected.extend(module.scan_directory(args.dir))
-        else:
-            all_detected.extend(module.scan_all())
+    directories = [args.dir] if args.dir else config.watch_directories
+    all_detected = scan_all_modules(modules, directories)
 
     if not all_detected:
         console.print("[green]No files to clean up[/green]")
@@ -275,7 +270,7 @@ def cmd_run(config: CleanupConfig, args: argparse.Namespace) -> int:  # NOSONAR
 
 def _dry_run(config: CleanupConfig) -> int:
     """Show what would be deleted. Returns 1 if files are found, 0 if clean."""
-    from .modules import discover_modules
+    from .modules import discover_modules, scan_all_modules
 
     console = Console()
     modules = discover_modules(config)
@@ -285,9 +280,7 @@ def _dry_run(config: CleanupConfig) -> int:
     console.print(f"[dim]Recovery enabled: {config.enable_recovery}[/dim]")
     console.print(f"[dim]Loaded modules: {', '.join(m.name for m in modules)}[/dim]\n")
 
-    all_detected: list[DetectedFile] = []
-    for module in modules:
-        all_detected.extend(module.scan_all())
+    all_detected = scan_all_modules(modules, config.watch_directories)
 
     if not all_detected:
         console.print("[green]No files to clean up[/green]")
@@ -2,15 +2,21 @@
 
 from __future__ import annotations
 
+import functools
 import importlib
+import itertools
 import logging
 import pkgutil
 import types
 from typing import TYPE_CHECKING
 
-from .base import CleanupModule
+from .._scan import scan_directories
+from .base import CleanupModule, DetectedFile, is_level_scanner, walk_levels
 
 if TYPE_CHECKING:
+    from collections.abc import Sequence
+    from pathlib import Path
+
     from ..config import CleanupConfig
 
 logger = logging.getLogger("icloud-cleanup")
@@ -19,10 +25,36 @@ logger = logging.getLogger("icloud-cleanup")
 def discover_modules(config: CleanupConfig) -> list[CleanupModule]:
     """Discover and instantiate all enabled cleanup modules.
 
-    Scans the modules package for classes with MODULE_ENABLED = True,
-    instantiates them with the config, and filters out disabled modules.
+    Instantiates every class with MODULE_ENABLED = True found in the modules
+    package with the config, and filters out disabled modules.
     """
-    modules: list[CleanupModule] = []
+    found: list[CleanupModule] = []
+
+    for cls in _discover_module_classes():
+        try:
+            instance = cls(config)
+        except (TypeError, ValueError):
+            logger.warning("Failed to instantiate module: %s", cls.__name__, exc_info=True)
+            continue
+
+        if instance.name in config.modules_disabled:
+            logger.info("Module disabled by config: %s", instance.name)
+            continue
+
+        found.append(instance)
+        logger.debug("Loaded module: %s", instance.name)
+
+    return found
+
+
+@functools.cache
+def _discover_module_classes() -> tuple[type, ...]:
+    """Import the modules package and collect its module classes.
+
+    The package contents do not change at runtime, so the pkgutil walk and
+    imports run once per process; only instantiation is repeated per call.
+    """
+    classes: list[type] = []
     package = importlib.import_module(__package__ or "icloud_cleanup.modules")
 
     for _finder, module_name, _is_pkg in pkgutil.iter_modules(package.__path__):
@@ -34,32 +66,48 @@ def discover_modules(config: CleanupConfig) -> list[CleanupModule]:
             logger.warning("Failed to import module: %s", module_name)
             continue
 
-        modules.extend(_find_module_classes(mod, config))
-    return modules
+        classes.extend(_find_module_classes(mod))
+    return tuple(classes)
 
 
-def _find_module_classes(mod: types.ModuleType, config: CleanupConfig) -> list[CleanupModule]:
-    """Instantiate all CleanupModule classes found in the given Python module."""
-    found: list[CleanupModule] = []
+def _find_module_classes(mod: types.ModuleType) -> list[type]:
+    """Return all enabled CleanupModule classes found in the given Python module."""
+    return [
+        attr
+        for attr_name in dir(mod)
+        if isinstance(attr := getattr(mod, attr_name), type)
+        and getattr(attr, "MODULE_ENABLED", False) is True
+        and attr_name != "CleanupModule"
+    ]
 
-    for attr_name in dir(mod):
-        attr = getattr(mod, attr_name)
-        if not (
-            isinstance(attr, type) and getattr(attr, "MODULE_ENABLED", False) is True and attr_name != "CleanupModule"
-        ):
-            continue
 
-        try:
-            instance = attr(config)
-        except (TypeError, ValueError):
-            logger.warning("Failed to instantiate module: %s", attr_name, exc_info=True)
-            continue
+def scan_all_modules(modules: Sequence[CleanupModule], directories: Sequence[Path]) -> list[DetectedFile]:
+    """Run a full scan for every module, walking each directory tree once.
 
-        if instance.name in config.modules_disabled:
-            logger.info("Module disabled by config: %s", instance.name)
-            continue
+    Modules implementing ``LevelScanner`` share a single walk per directory,
+    so a tree is listed once instead of once per module; any other module
+    falls back to its own ``scan_directory()``. Results are grouped by
+    module, in module order.
+    """
+    if not directories or not modules:
+        return []
 
-        found.append(instance)
-        logger.debug("Loaded module: %s", instance.name)
+    results: list[list[DetectedFile]] = [[] for _ in modules]
+    fusable = [(index, module) for index, module in enumerate(modules) if is_level_scanner(module)]
+    positions = [index for index, _module in fusable]
+    scanners = [module for _index, module in fusable]
 
-    return found
+    if scanners:
+
+        def walk(directory: Path) -> list[tuple[int, DetectedFile]]:
+            return list(walk_levels(directory, scanners))
+
+        for index, detected in scan_directories(walk, directories):
+            results[positions[index]].append(detected)
+
+    fused = set(positions)
+    for index, module in enumerate(modules):
+        if index not in fused:
+            results[index].extend(scan_directories(module.scan_directory, directories))
+
+    return list(itertools.chain.from_iterable(results))
@@ -2,12 +2,20 @@
 
 from __future__ import annotations
 
+import errno
+import logging
+import os
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Protocol, runtime_checkable
+from typing import TYPE_CHECKING, Protocol, TypeGuard, runtime_checkable
 
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Iterator, Sequence
 
-@dataclass(frozen=True)
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True, slots=True)
 class DetectedFile:
     """Immutable record of a file flagged for cleanup, with module provenance."""
 
@@ -52,23 +60,92 @@ class CleanupModule(Protocol):
         """
         ...
 
-    def scan_directory(self, directory: Path) -> list[DetectedFile]:
+    def scan_directory(self, directory: Path) -> Iterable[DetectedFile]:
         """Scan a directory for files to clean.
 
         Args:
             directory: Directory to scan.
 
         Returns:
-            List of detected files.
+            Detected files; may be a lazy iterator, so callers iterate once.
 
         """
         ...
 
-    def scan_all(self) -> list[DetectedFile]:
-        """Scan all configured directories.
+
+class LevelScanner(Protocol):
+    """Optional extension: a module that can scan a directory listing it did not read itself.
+
+    Modules implementing this share a single tree walk (see ``walk_levels``)
+    instead of each listing every directory on its own.
+    """
+
+    def scan_entries(self, directory: str, entries: Sequence[os.DirEntry[str]]) -> tuple[list[DetectedFile], list[str]]:
+        """Scan one directory level from an existing listing.
+
+        Args:
+            directory: Directory the entries were listed from.
+            entries: The directory's scandir entries.
 
         Returns:
-            List of all detected files.
+            Files detected at this level, and the subdirectories to descend into.
 
         """
         ...
+
+
+def is_level_scanner(obj: object) -> TypeGuard[LevelScanner]:
+    """Structural check for the optional ``LevelScanner`` extension (``scan_entries`` is callable)."""
+    return callable(getattr(obj, "scan_entries", None))
+
+
+def walk_levels(directory: Path, scanners: Sequence[LevelScanner]) -> Iterator[tuple[int, DetectedFile]]:
+    """Walk a tree once, handing each directory listing to every scanner that descended into it.
+
+    Uses an explicit stack, so deep trees cannot hit the recursion limit, and
+    each directory is read with a single scandir() however many scanners
+    share the walk. A subdirectory is visited only by the scanners that asked
+    for it. Unreadable directories are skipped (a warning for ``directory``
+    itself, debug below it), as are directories that vanish mid-walk, a
+    ``directory`` that is not a directory, and EDEADLK directories iCloud is
+    still materializing.
+
+    Yields:
+        ``(scanner index, detected file)`` pairs, one directory level at a time.
+
+    """
+    if not directory.exists():
+        return
+
+    top = os.fspath(directory)
+    pending: list[tuple[str, tuple[int, ...]]] = [(top, tuple(range(len(scanners))))]
+    while pending:
+        current, active = pending.pop()
+        try:
+            with os.scandir(current) as iterator:
+                entries = list(iterator)
+        except PermissionError:
+            if current == top:
+                logger.warning("Permission denied scanning: %s", directory)
+            else:
+                logger.debug("Permission denied scanning: %s", current)
+            continue
+        except (FileNotFoundError, NotADirectoryError):
+            logger.debug("Directory vanished or is not a directory: %s", current)
+            continue
+        except OSError as exc:
+            if exc.errno != errno.EDEADLK:
+                raise
+            logger.warning("EDEADLK (iCloud transient) — skipping directory: %s", current)
+            continue
+
+        wanted: dict[str, list[int]] = {}
+        for index in active:
+            detected, subdirs = scanners[index].scan_entries(current, entries)
+            for item in detected:
+                yield index, item
+            for subdir in subdirs:
+                wanted.setdefault(subdir, []).append(index)
+
+        # Reversed so subdirectories are visited in scandir order
+        pending.extend((subdir, tuple(indices)) for subdir, indices in reversed(wanted.items()))
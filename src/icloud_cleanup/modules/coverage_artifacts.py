@@ -7,21 +7,32 @@ coverage.py runs when the merged .coverage database exists.
 from __future__ import annotations
 
 import logging
+import os
 import re
+import stat
 from pathlib import Path
 from typing import TYPE_CHECKING
 
-from .base import DetectedFile
+from .base import DetectedFile, walk_levels
 
 if TYPE_CHECKING:
+    from collections.abc import Sequence
+
     from ..config import CleanupConfig
 
-_PATTERN = re.compile(r"^\.coverage\..+\.pid\d+\..+$")
+_MERGED = ".coverage"
+_PREFIX = ".coverage."
+_PATTERN = re.compile(r"\.coverage\..+\.pid\d+\..+")
 _SKIP_DIRS = frozenset({".git", ".venv", "venv", "node_modules", ".tox", "__pycache__"})
 
 logger = logging.getLogger(__name__)
 
 
+def _is_artifact_name(name: str) -> bool:
+    """Match an artifact name; the prefix test rejects almost every name before the regex runs."""
+    return name.startswith(_PREFIX) and _PATTERN.fullmatch(name) is not None
+
+
 class CoverageArtifactsModule:
     """Detects and cleans up stale coverage.py parallel artifacts."""
 
@@ -35,26 +46,34 @@ class CoverageArtifactsModule:
     @staticmethod
     def can_match(name: str) -> bool:
         """Check if a filename could be a coverage artifact (regex only, no I/O)."""
-        return _PATTERN.match(name) is not None
+        return _is_artifact_name(name)
 
     def is_target(self, path: Path) -> DetectedFile | None:
         """Check if a file is a stale coverage artifact.
 
         A file matches when:
         1. Its name matches .coverage.<host>.pid<N>.<hash>
-        2. A merged .coverage file exists in the same directory
+        2. It is a regular file (not a symlink), per a single lstat()
+        3. A merged .coverage file exists in the same directory
 
         """
-        if not _PATTERN.match(path.name):
+        if not _is_artifact_name(path.name):
             return None
 
-        if not path.is_file():
+        try:
+            mode = os.lstat(path).st_mode
+        except (FileNotFoundError, NotADirectoryError):
+            return None
+        if not stat.S_ISREG(mode):
             return None
 
-        merged = path.parent / ".coverage"
-        if not merged.is_file():
+        if not os.path.isfile(os.path.join(os.path.dirname(path), _MERGED)):
             return None
 
+        return self._detected(path)
+
+    def _detected(self, path: Path) -> DetectedFile:
+        """Build the DetectedFile record for a stale artifact."""
         return DetectedFile(
             path=path,
             module_name=self.name,
@@ -63,33 +82,35 @@ class CoverageArtifactsModule:
         )
 
     def scan_directory(self, directory: Path) -> list[DetectedFile]:
-        """Scan a directory for stale coverage artifacts."""
-        detected: list[DetectedFile] = []
+        """Scan a directory tree for stale coverage artifacts.
 
-        if not directory.exists():
-            return detected
+        Walks with os.scandir so file types come from the cached DirEntry
+        data; names are matched before any stat() and symlinked directories
+        are not descended into.
+        """
+        return [detected for _index, detected in walk_levels(directory, (self,))]
 
-        try:
-            for path in directory.rglob(".*"):
-                if any(part in _SKIP_DIRS for part in path.parts):
-                    continue
-                try:
-                    result = self.is_target(path)
-                except PermissionError:
-                    logger.debug("Permission denied checking: %s", path)
-                    continue
-                if result:
-                    detected.append(result)
-        except PermissionError:
-            logger.warning("Permission denied scanning: %s", directory)
-
-        return detected
-
-    def scan_all(self) -> list[DetectedFile]:
-        """Scan all configured watch directories."""
-        all_detected: list[DetectedFile] = []
-
-        for directory in self.config.watch_directories:
-            all_detected.extend(self.scan_directory(directory))
-
-        return all_detected
+    def scan_entries(self, directory: str, entries: Sequence[os.DirEntry[str]]) -> tuple[list[DetectedFile], list[str]]:
+        """Scan one listed directory level: return stale artifacts and subdirectories to descend into."""
+        detected: list[DetectedFile] = []
+        subdirs: list[str] = []
+        # Whether the merged .coverage exists; answered from the listing we
+        # already hold, once per directory and only if an artifact shows up
+        has_merged: bool | None = None
+
+        for entry in entries:
+            name = entry.name
+            try:
+                if _is_artifact_name(name):
+                    if not entry.is_file(follow_symlinks=False):
+                        continue
+                    if has_merged is None:
+                        has_merged = any(e.name == _MERGED and e.is_file() for e in entries)
+                    if has_merged:
+                        detected.append(self._detected(Path(entry.path)))
+                elif name not in _SKIP_DIRS and entry.is_dir(follow_symlinks=False):
+                    subdirs.append(entry.path)
+            except PermissionError:
+                logger.debug("Permission denied checking: %s", entry.path)
+
+        return detected, subdirs
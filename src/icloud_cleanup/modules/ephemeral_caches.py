@@ -6,18 +6,30 @@ Detects and deletes regenerable cache directories (.mypy_cache, __pycache__,
 
 from __future__ import annotations
 
+import functools
 import logging
+import os
+import stat
 from pathlib import Path
 from typing import TYPE_CHECKING
 
-from ..nosync import EPHEMERAL_PATTERNS, NOSYNC_SUFFIX, NosyncManager
-from .base import DetectedFile
+from ..nosync import EPHEMERAL_PATTERNS, NOSYNC_SUFFIX, VALUABLE_PATTERNS, split_patterns
+from .base import DetectedFile, walk_levels
 
 if TYPE_CHECKING:
+    from collections.abc import Iterator, Sequence
+
     from ..config import CleanupConfig
 
 logger = logging.getLogger(__name__)
 
+# Built-in patterns split once at import: exact names and "*suffix" wildcards
+_BUILTIN_EXACT, _BUILTIN_SUFFIXES = split_patterns(EPHEMERAL_PATTERNS)
+
+# Large trees the scan never descends into: valuable dirs (handled by the
+# nosync guardian, not cache cleanup) and VCS metadata
+_PRUNE_PATTERNS: frozenset[str] = VALUABLE_PATTERNS | {".git"}
+
 
 class EphemeralCachesModule:
     """Detects ephemeral cache directories for deletion."""
@@ -28,94 +40,119 @@ class EphemeralCachesModule:
 
     def __init__(self, config: CleanupConfig) -> None:
         self.config = config
-        self._extra_patterns: frozenset[str] = frozenset(config.nosync_ephemeral_patterns)
+        self._extra_exact, self._extra_suffixes = split_patterns(config.nosync_ephemeral_patterns)
+        # Basenames like __pycache__ recur in every project; patterns are fixed
+        # per instance, so the name -> reason mapping can be memoized
+        self._match_reason = functools.lru_cache(maxsize=4096)(self._compute_match_reason)
+        self._prune_exact, self._prune_suffixes = split_patterns(
+            _PRUNE_PATTERNS | frozenset(config.nosync_valuable_patterns)
+        )
+
+    @staticmethod
+    def _matches_builtin(name: str) -> bool:
+        """Check a name against the built-in ephemeral patterns."""
+        return name in _BUILTIN_EXACT or name.endswith(_BUILTIN_SUFFIXES)
+
+    def _matches_extra(self, name: str) -> bool:
+        """Check a name against user-configured ephemeral patterns."""
+        return name in self._extra_exact or name.endswith(self._extra_suffixes)
+
+    def _compute_match_reason(self, name: str) -> str | None:
+        """Return the detection reason for a non-.nosync name, or None if it is not a cache."""
+        if self._matches_builtin(name):
+            return f"Ephemeral cache directory: {name}"
+        if self._matches_extra(name):
+            return f"Ephemeral cache directory (custom pattern): {name}"
+        return None
 
     def can_match(self, name: str) -> bool:
         """Check if a name could be an ephemeral cache (string only, no I/O)."""
         if name.endswith(NOSYNC_SUFFIX):
             return False
-        if NosyncManager.matches_patterns(name, EPHEMERAL_PATTERNS):
-            return True
-        return bool(self._extra_patterns and NosyncManager.matches_patterns(name, self._extra_patterns))
+        return self._match_reason(name) is not None
 
     def is_target(self, path: Path) -> DetectedFile | None:
         """Check if a path is an ephemeral cache directory.
 
-        A path matches when it is a directory whose name matches a known
-        ephemeral pattern (built-in or user-configured) and does not
-        already have a .nosync suffix.
+        A path matches when it is a directory (not a symlink to one) whose
+        name matches a known ephemeral pattern (built-in or user-configured)
+        and does not already have a .nosync suffix. Costs one lstat().
         """
         name = path.name
         if name.endswith(NOSYNC_SUFFIX):
             return None
 
-        if NosyncManager.matches_patterns(name, EPHEMERAL_PATTERNS):
-            if not path.is_dir():
-                return None
-            return DetectedFile(
-                path=path,
-                module_name=self.name,
-                reason=f"Ephemeral cache directory: {name}",
-                recovery_enabled=False,
-            )
-
-        if self._extra_patterns and NosyncManager.matches_patterns(name, self._extra_patterns):
-            if not path.is_dir():
-                return None
-            return DetectedFile(
-                path=path,
-                module_name=self.name,
-                reason=f"Ephemeral cache directory (custom pattern): {name}",
-                recovery_enabled=False,
-            )
-
-        return None
-
-    def scan_directory(self, directory: Path) -> list[DetectedFile]:
-        """Scan a directory tree for ephemeral cache directories.
-
-        Skips .nosync subtrees and subtrees of already-found candidates
-        to avoid reporting nested caches (e.g. build/lib/__pycache__
-        when build/ is already detected).
-        """
-        detected: list[DetectedFile] = []
-
-        if not directory.exists():
-            return detected
-
-        skip_prefixes: list[str] = []
+        reason = self._match_reason(name)
+        if reason is None:
+            return None
 
         try:
-            for item in directory.rglob("*"):
-                item_str = str(item)
+            mode = os.lstat(path).st_mode
+        except (FileNotFoundError, NotADirectoryError):
+            return None
+        if not stat.S_ISDIR(mode):
+            return None
 
-                if any(item_str.startswith(prefix) for prefix in skip_prefixes):
-                    continue
+        return self._detected(path, reason)
 
-                # Skip .nosync subtrees
-                if item.is_dir() and item.name.endswith(NOSYNC_SUFFIX):
-                    skip_prefixes.append(f"{item_str}/")
-                    continue
+    def is_target_entry(self, entry: os.DirEntry[str]) -> DetectedFile | None:
+        """Check a scandir entry, reusing its cached file type instead of stat()."""
+        name = entry.name
+        if name.endswith(NOSYNC_SUFFIX):
+            return None
 
-                try:
-                    result = self.is_target(item)
-                except PermissionError:
-                    logger.debug("Permission denied checking: %s", item)
-                    continue
+        reason = self._match_reason(name)
+        if reason is None or not entry.is_dir(follow_symlinks=False):
+            return None
+
+        return self._detected(Path(entry.path), reason)
 
-                if result:
-                    detected.append(result)
-                    skip_prefixes.append(f"{item_str}/")
-        except PermissionError:
-            logger.warning("Permission denied scanning: %s", directory)
+    def _detected(self, path: Path, reason: str) -> DetectedFile:
+        """Build the DetectedFile record for a matched cache directory."""
+        return DetectedFile(
+            path=path,
+            module_name=self.name,
+            reason=reason,
+            recovery_enabled=False,
+        )
 
-        return detected
+    def scan_directory(self, directory: Path) -> Iterator[DetectedFile]:
+        """Lazily scan a directory tree for ephemeral cache directories.
 
-    def scan_all(self) -> list[DetectedFile]:
-        """Scan all configured watch directories."""
-        all_detected: list[DetectedFile] = []
+        Skips .nosync subtrees, valuable dirs (.venv, node_modules, ...),
+        .git, and subtrees of already-found candidates to avoid reporting
+        nested caches (e.g. build/lib/__pycache__ when build/ is already
+        detected). Results are produced one directory level at a time.
+        """
+        for _index, detected in walk_levels(directory, (self,)):
+            yield detected
 
-        for directory in self.config.watch_directories:
-            all_detected.extend(self.scan_directory(directory))
+    def scan_entries(self, directory: str, entries: Sequence[os.DirEntry[str]]) -> tuple[list[DetectedFile], list[str]]:
+        """Scan one listed directory level: return detected caches and subdirectories to descend into.
 
-        return all_detected
+        Symlinked directories are never descended into; ``DirEntry.is_dir``
+        reuses the file type from readdir, so no stat() calls are needed.
+        """
+        detected: list[DetectedFile] = []
+        subdirs: list[str] = []
+
+        for entry in entries:
+            name = entry.name
+            # .nosync dirs are never targets and their subtrees are already excluded
+            if name.endswith(NOSYNC_SUFFIX):
+                continue
+
+            try:
+                target = self.is_target_entry(entry)
+                # The file type is cached on the entry, so asking again costs nothing
+                descend = target is None and entry.is_dir(follow_symlinks=False)
+            except PermissionError:
+                logger.debug("Permission denied checking: %s", entry.path)
+                continue
+
+            if target is not None:
+                detected.append(target)
+            elif descend and not (name in self._prune_exact or name.endswith(self._prune_suffixes)):
+                subdirs.append(entry.path)
+
+        return detected, subdirs
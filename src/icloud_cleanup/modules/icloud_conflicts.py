@@ -3,21 +3,31 @@
 from __future__ import annotations
 
 import errno
+import functools
 import logging
+import os
 import re
 from dataclasses import dataclass
 from pathlib import Path
 from typing import TYPE_CHECKING
 
-from .base import DetectedFile
+from ..config import DEFAULT_CONFLICT_PATTERN
+from .base import DetectedFile, walk_levels
 
 if TYPE_CHECKING:
+    from collections.abc import Sequence
+
     from ..config import CleanupConfig
 
 logger = logging.getLogger(__name__)
 
 
-@dataclass
+def _lacks_whitespace(name: str) -> bool:
+    """Cheap reject for the default pattern: a printable ASCII name without a space has no ``\\s``."""
+    return " " not in name and name.isascii() and name.isprintable()
+
+
+@dataclass(frozen=True)
 class ConflictFile:
     """Parsed components of an iCloud conflict filename (original name, number, extension)."""
 
@@ -26,9 +36,9 @@ class ConflictFile:
     conflict_number: int
     extension: str | None
 
-    @property
+    @functools.cached_property
     def original_path(self) -> Path:
-        """Get the path to the original (non-conflict) file."""
+        """Get the path to the original (non-conflict) file, computed once per instance."""
         original_filename = f"{self.original_name}{self.extension}" if self.extension else self.original_name
         return self.path.parent / original_filename
 
@@ -46,24 +56,35 @@ class ICloudConflictsModule:
     def __init__(self, config: CleanupConfig) -> None:
         self.config = config
         self._pattern = re.compile(config.conflict_pattern)
+        # The default pattern needs whitespace before the number; custom ones may not
+        self._requires_whitespace = config.conflict_pattern == DEFAULT_CONFLICT_PATTERN
 
     def can_match(self, name: str) -> bool:
         """Check if a filename could be a conflict (regex only, no I/O)."""
-        return self._pattern.match(name) is not None
+        return self._parse_name(name) is not None
+
+    def _parse_name(self, name: str) -> tuple[str, int, str | None] | None:
+        """Split a conflict filename into (original name, conflict number, extension)."""
+        if self._requires_whitespace and _lacks_whitespace(name):
+            return None
+
+        match = self._pattern.match(name)
+        if not match:
+            return None
+
+        extension = match.group(3) if match.lastindex and match.lastindex >= 3 else None
+        return match.group(1).rstrip(), int(match.group(2)), extension
 
     def _match_conflict(self, path: Path) -> ConflictFile | None:
         """Match a path against the conflict pattern."""
-        match = self._pattern.match(path.name)
-        if not match:
+        parsed = self._parse_name(path.name)
+        if parsed is None:
             return None
 
         if not path.is_file():
             return None
 
-        original_name = match.group(1).rstrip()
-        conflict_number = int(match.group(2))
-        extension = match.group(3) if match.lastindex and match.lastindex >= 3 else None
-
+        original_name, conflict_number, extension = parsed
         return ConflictFile(
             path=path,
             original_name=original_name,
@@ -72,62 +93,85 @@ class ICloudConflictsModule:
         )
 
     def is_target(self, path: Path) -> DetectedFile | None:
-        """Check if a path is an iCloud conflict file with an existing original."""
-        conflict = self._match_conflict(path)
-        if conflict is None:
+        """Check if a path is an iCloud conflict file with an existing original.
+
+        Works on the parsed name tuple; no ConflictFile is built on this path.
+        """
+        parsed = self._parse_name(path.name)
+        if parsed is None:
+            return None
+
+        if not path.is_file():
             return None
 
-        if not conflict.original_path.exists():
+        original_name, conflict_number, extension = parsed
+        original_filename = f"{original_name}{extension}" if extension else original_name
+        if not os.path.exists(os.path.join(os.path.dirname(path), original_filename)):
             return None
 
+        return self._detected(path, conflict_number, original_filename)
+
+    def _check_entry(
+        self,
+        entry: os.DirEntry[str],
+        parsed: tuple[str, int, str | None],
+        sibling_names: set[str],
+    ) -> DetectedFile | None:
+        """Scan-time is_target: the original is looked up in the already-listed sibling names."""
+        original_name, conflict_number, extension = parsed
+        original_filename = f"{original_name}{extension}" if extension else original_name
+        if original_filename not in sibling_names or not entry.is_file():
+            return None
+
+        return self._detected(Path(entry.path), conflict_number, original_filename)
+
+    def _detected(self, path: Path, conflict_number: int, original_filename: str) -> DetectedFile:
+        """Build the DetectedFile record for a conflict with an existing original."""
         return DetectedFile(
             path=path,
             module_name=self.name,
-            reason=f"iCloud conflict #{conflict.conflict_number} of {conflict.original_path.name}",
+            reason=f"iCloud conflict #{conflict_number} of {original_filename}",
             recovery_enabled=True,
         )
 
-    def _check_single_path(self, path: Path) -> DetectedFile | None:
-        """Check a single path, handling iCloud transient errors."""
-        try:
-            return self.is_target(path)
-        except PermissionError:
-            logger.debug("Permission denied checking: %s", path)
-        except OSError as exc:
-            if exc.errno == errno.EDEADLK:
-                logger.warning("EDEADLK (iCloud transient) — skipping: %s", path)
-            else:
-                raise
-        return None
-
     def scan_directory(self, directory: Path) -> list[DetectedFile]:
-        """Scan a directory for conflict files."""
-        if not directory.exists():
-            return []
+        """Scan a directory tree for conflict files.
+
+        Walks with os.scandir and an explicit stack; only entries whose name
+        matches the conflict pattern are checked, originals are found in the
+        directory listing itself, and symlinked directories are not
+        descended into.
+        """
+        return [detected for _index, detected in walk_levels(directory, (self,))]
 
+    def scan_entries(self, directory: str, entries: Sequence[os.DirEntry[str]]) -> tuple[list[DetectedFile], list[str]]:
+        """Scan one listed directory level: return conflicts and subdirectories to descend into."""
         detected: list[DetectedFile] = []
-        try:
-            for path in directory.rglob("*"):
-                if result := self._check_single_path(path):
-                    detected.append(result)
-        except PermissionError:
-            logger.warning("Permission denied scanning: %s", directory)
-        except OSError as exc:
-            if exc.errno == errno.EDEADLK:
-                logger.warning("EDEADLK (iCloud transient) during rglob — aborting scan: %s", directory)
-            else:
-                raise
-
-        return detected
-
-    def scan_all(self) -> list[DetectedFile]:
-        """Scan all configured watch directories."""
-        all_detected: list[DetectedFile] = []
-
-        for directory in self.config.watch_directories:
-            all_detected.extend(self.scan_directory(directory))
-
-        return all_detected
+        subdirs: list[str] = []
+        # Names from the listing we already hold answer "does the original
+        # exist?" without a stat(); built only once a candidate shows up
+        sibling_names: set[str] | None = None
+
+        for entry in entries:
+            # One handler per entry covers the match, the file/original checks and is_dir
+            try:
+                parsed = self._parse_name(entry.name)
+                if parsed is not None:
+                    if sibling_names is None:
+                        sibling_names = {sibling.name for sibling in entries}
+                    if result := self._check_entry(entry, parsed, sibling_names):
+                        detected.append(result)
+                        continue
+                if entry.is_dir(follow_symlinks=False):
+                    subdirs.append(entry.path)
+            except PermissionError:
+                logger.debug("Permission denied checking: %s", entry.path)
+            except OSError as exc:
+                if exc.errno != errno.EDEADLK:
+                    raise
+                logger.warning("EDEADLK (iCloud transient) — skipping: %s", entry.path)
+
+        return detected, subdirs
 
     def get_conflict_file(self, path: Path) -> ConflictFile | None:
         """Get ConflictFile for a path (for backward compatibility)."""
@@ -2,13 +2,20 @@
 
 from __future__ import annotations
 
+import functools
 import logging
+import os
 import re
+import stat
 from dataclasses import dataclass
 from pathlib import Path
 from typing import TYPE_CHECKING, Literal
 
+from ._scan import scan_directories
+
 if TYPE_CHECKING:
+    from collections.abc import Collection
+
     from .config import CleanupConfig
 
 NosyncAction = Literal["converted", "skipped", "error"]
@@ -47,7 +54,31 @@ EPHEMERAL_PATTERNS: frozenset[str] = frozenset(
 DEFAULT_EXCLUDE_PATTERNS: frozenset[str] = VALUABLE_PATTERNS | EPHEMERAL_PATTERNS
 
 
-@dataclass
+def split_patterns(patterns: Collection[str]) -> tuple[frozenset[str], tuple[str, ...]]:
+    """Partition patterns into exact names and the suffixes of ``*suffix`` wildcards.
+
+    The result matches a name with ``name in exact or name.endswith(suffixes)``,
+    the semantics ``NosyncManager.matches_patterns`` implements on top of it.
+    """
+    exact = frozenset(pattern for pattern in patterns if not pattern.startswith("*"))
+    suffixes = tuple(sorted(pattern[1:] for pattern in patterns if pattern.startswith("*")))
+    return exact, suffixes
+
+
+_DEFAULT_EXACT, _DEFAULT_SUFFIXES = split_patterns(DEFAULT_EXCLUDE_PATTERNS)
+
+
+def _is_candidate_name(name: str) -> bool:
+    """String-only candidate check: a built-in pattern name that is not already .nosync."""
+    return not name.endswith(NOSYNC_SUFFIX) and (name in _DEFAULT_EXACT or name.endswith(_DEFAULT_SUFFIXES))
+
+
+# Pattern sets are frozensets (hashable, hash cached), and only a handful
+# distinct ones exist: the built-ins plus their unions with user config
+_split_patterns_cached = functools.lru_cache(maxsize=32)(split_patterns)
+
+
+@dataclass(frozen=True, slots=True)
 class RepairResult:
     """Result of a symlink repair operation."""
 
@@ -57,7 +88,7 @@ class RepairResult:
     detail: str
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class NosyncResult:
     """Result of a nosync operation."""
 
@@ -77,41 +108,44 @@ class NosyncManager:
 
     @staticmethod
     def is_nosync_candidate(path: Path) -> bool:
-        """Check if a directory should be excluded from iCloud sync."""
-        if not path.is_dir():
-            return False
-        if path.name.endswith(NOSYNC_SUFFIX):
-            return False
-        return NosyncManager.matches_patterns(path.name, DEFAULT_EXCLUDE_PATTERNS)
+        """Check if a directory should be excluded from iCloud sync.
+
+        The name is checked first, so only matching names cost a stat().
+        """
+        return _is_candidate_name(path.name) and path.is_dir()
 
     @staticmethod
     def is_valuable_candidate(path: Path) -> bool:
         """Check if a directory is a valuable nosync candidate (slow to rebuild)."""
-        if not path.is_dir() or path.name.endswith(NOSYNC_SUFFIX):
+        name = path.name
+        if name.endswith(NOSYNC_SUFFIX) or not NosyncManager.matches_patterns(name, VALUABLE_PATTERNS):
             return False
-        return NosyncManager.matches_patterns(path.name, VALUABLE_PATTERNS)
+        return path.is_dir()
 
     @staticmethod
     def is_ephemeral_candidate(path: Path) -> bool:
         """Check if a directory is an ephemeral cache (fast to regenerate)."""
-        if not path.is_dir() or path.name.endswith(NOSYNC_SUFFIX):
+        name = path.name
+        if name.endswith(NOSYNC_SUFFIX) or not NosyncManager.matches_patterns(name, EPHEMERAL_PATTERNS):
             return False
-        return NosyncManager.matches_patterns(path.name, EPHEMERAL_PATTERNS)
+        return path.is_dir()
 
     @staticmethod
     def matches_patterns(name: str, patterns: frozenset[str]) -> bool:
-        """Check a directory name against a set of patterns (exact or wildcard)."""
-        for pattern in patterns:
-            if pattern.startswith("*"):
-                if name.endswith(pattern[1:]):
-                    return True
-            elif name == pattern:
-                return True
-        return False
+        """Check a directory name against a set of patterns (exact or wildcard).
+
+        The pattern set is split once and cached, so a call is one set lookup
+        plus one ``str.endswith`` over the wildcard suffixes.
+        """
+        exact, suffixes = _split_patterns_cached(patterns)
+        return name in exact or name.endswith(suffixes)
 
     def convert_to_nosync(self, path: Path) -> NosyncResult:
         """Rename the directory to .nosync suffix and create a symlink at the original path."""
-        if not path.exists():
+        # One lstat() answers exists / is-symlink / is-directory
+        try:
+            mode = os.lstat(path).st_mode
+        except (FileNotFoundError, NotADirectoryError):
             return NosyncResult(
                 path=path,
                 success=False,
@@ -119,50 +153,53 @@ class NosyncManager:
                 error="Path does not exist",
             )
 
-        if not path.is_dir():
+        if stat.S_ISLNK(mode):
             return NosyncResult(
                 path=path,
                 success=False,
                 action="skipped",
-                error="Not a directory",
+                error="Already a symlink",
             )
 
-        if path.is_symlink():
+        if not stat.S_ISDIR(mode):
             return NosyncResult(
                 path=path,
                 success=False,
                 action="skipped",
-                error="Already a symlink",
+                error="Not a directory",
             )
 
-        nosync_path = path.parent / f"{path.name}{NOSYNC_SUFFIX}"
+        # Plain os calls on str paths; a Path is only built for the result
+        source = os.fspath(path)
+        nosync_name = f"{path.name}{NOSYNC_SUFFIX}"
+        target = os.path.join(os.path.dirname(source), nosync_name)
 
-        if nosync_path.exists():
+        if os.path.exists(target):
             return NosyncResult(
                 path=path,
                 success=False,
                 action="skipped",
-                error=f"{nosync_path.name} already exists",
+                error=f"{nosync_name} already exists",
             )
 
         try:
             # Rename directory to .nosync
-            path.rename(nosync_path)
+            os.rename(source, target)
 
             # Create symlink from the original name to .nosync
-            path.symlink_to(nosync_path.name)
+            os.symlink(nosync_name, source)
 
             self.logger.info(
                 "Converted to nosync: %s -> %s",
                 path.name,
-                nosync_path.name,
+                nosync_name,
             )
 
             return NosyncResult(
                 path=path,
                 success=True,
                 action="converted",
-                nosync_path=nosync_path,
+                nosync_path=Path(target),
             )
 
         except PermissionError as error:
@@ -183,49 +220,60 @@ class NosyncManager:
             )
 
     def scan_for_candidates(self, directory: Path) -> list[Path]:
-        """Scan the directory tree, skipping subtrees of found candidates and .nosync dirs."""
+        """Scan the directory tree, skipping subtrees of found candidates and .nosync dirs.
+
+        Walks with os.scandir and an explicit stack, so file types come from
+        the cached DirEntry data and pruned subtrees are never listed at all.
+        Symlinked directories are not descended into, and directories that
+        vanish mid-walk (or a ``directory`` that is a file) are skipped.
+        """
         candidates: list[Path] = []
 
         if not directory.exists():
             return candidates
 
-        skip_prefixes: list[str] = []
+        top = os.fspath(directory)
+        pending = [top]
+        while pending:
+            current = pending.pop()
+            try:
+                pending.extend(self._scan_level(current, candidates))
+            except PermissionError:
+                if current == top:
+                    self.logger.warning("Permission denied scanning: %s", directory)
+                else:
+                    self.logger.debug("Permission denied scanning: %s", current)
+            except (FileNotFoundError, NotADirectoryError):
+                self.logger.debug("Directory vanished or is not a directory: %s", current)
 
-        try:
-            for item in directory.rglob("*"):
-                item_str = str(item)
+        return sorted(candidates)
 
-                if any(item_str.startswith(prefix) for prefix in skip_prefixes):
-                    continue
+    def _scan_level(self, directory: str, candidates: list[Path]) -> list[str]:
+        """Collect candidates in one directory into ``candidates``; return subdirectories to descend into."""
+        subdirs: list[str] = []
 
+        with os.scandir(directory) as entries:
+            for entry in entries:
+                name = entry.name
+                # .nosync dirs are never candidates and their subtrees are already excluded
+                if name.endswith(NOSYNC_SUFFIX):
+                    continue
                 try:
-                    is_candidate = self.is_nosync_candidate(item)
+                    # Work on the str name; a Path is only built for hits
+                    if _is_candidate_name(name) and entry.is_dir():
+                        candidates.append(Path(entry.path))
+                    elif entry.is_dir(follow_symlinks=False):
+                        subdirs.append(entry.path)
                 except PermissionError:
-                    self.logger.warning(
-                        "Permission denied checking: %s",
-                        item,
-                    )
-                    continue
+                    self.logger.warning("Permission denied checking: %s", entry.path)
 
-                if is_candidate:
-                    candidates.append(item)
-                    skip_prefixes.append(f"{item_str}/")
-                elif item.is_dir() and item.name.endswith(NOSYNC_SUFFIX):
-                    skip_prefixes.append(f"{item_str}/")
-        except PermissionError:
-            self.logger.warning("Permission denied scanning: %s", directory)
-
-        return sorted(candidates)
+        return subdirs
 
     def scan_all(self) -> list[Path]:
-        """Scan all watch directories for nosync candidates."""
-        all_candidates: list[Path] = []
-
-        for directory in self.config.watch_directories:
-            candidates = self.scan_for_candidates(directory)
-            all_candidates.extend(candidates)
-
-        return all_candidates
+        """Scan all watch directories for nosync candidates (concurrently when there are several)."""
+        # Missing roots are dropped up front so they never cost a pool dispatch
+        roots = [directory for directory in self.config.watch_directories if os.path.isdir(directory)]
+        return list(scan_directories(self.scan_for_candidates, roots))
 
     def _get_valuable_patterns(self) -> frozenset[str]:
         """Return built-in valuable patterns extended by user config."""
@@ -252,49 +300,47 @@ class NosyncManager:
         results: list[RepairResult] = []
         valuable = self._get_valuable_patterns()
 
+        # One listing serves every lookup below: .nosync dirs, their symlinks
+        # and conflict copies are all found by name, with types from readdir
         try:
-            children = sorted(directory.iterdir())
+            with os.scandir(directory) as iterator:
+                entries = {entry.name: entry for entry in iterator}
         except PermissionError:
             self.logger.warning("Permission denied listing: %s", directory)
             return []
 
-        for child in children:
-            if not child.is_dir() or child.is_symlink():
-                continue
-            if not child.name.endswith(NOSYNC_SUFFIX):
+        for name in sorted(entries):
+            if not name.endswith(NOSYNC_SUFFIX):
                 continue
-
-            original_name = child.name.removesuffix(NOSYNC_SUFFIX)
+            original_name = name.removesuffix(NOSYNC_SUFFIX)
             if not self.matches_patterns(original_name, valuable):
                 continue
+            if not entries[name].is_dir(follow_symlinks=False):
+                continue
 
-            result = self._repair_symlink(directory, child, original_name)
+            result = self._repair_symlink(directory, Path(entries[name].path), original_name, entries)
             if result is not None:
                 results.append(result)
 
         return results
 
-    def _remove_conflict_symlinks(self, parent: Path, original_name: str) -> None:
+    def _remove_conflict_symlinks(self, original_name: str, entries: dict[str, os.DirEntry[str]]) -> None:
         """Remove all iCloud conflict symlinks for a given name (e.g. '.venv 2', '.venv 3')."""
-        try:
-            children = parent.iterdir()
-        except PermissionError:
-            return
-
         conflict_re = re.compile(rf"^{re.escape(original_name)}\s+([2-9]|\d{{2,}})$")
-        for child in children:
-            if child.is_symlink() and conflict_re.match(child.name):
+        for name, entry in entries.items():
+            if conflict_re.match(name) and entry.is_symlink():
                 try:
-                    child.unlink()
-                    self.logger.info("Removed conflict symlink: %s", child.name)
+                    os.unlink(entry.path)
+                    self.logger.info("Removed conflict symlink: %s", name)
                 except OSError as error:
-                    self.logger.warning("Failed to remove conflict symlink %s: %s", child.name, error)
+                    self.logger.warning("Failed to remove conflict symlink %s: %s", name, error)
 
     def _repair_symlink(
         self,
         parent: Path,
         nosync_path: Path,
         original_name: str,
+        entries: dict[str, os.DirEntry[str]],
     ) -> RepairResult | None:
         """Ensure a correct symlink exists for a .nosync directory.
 
@@ -305,17 +351,19 @@ class NosyncManager:
             parent: Directory containing the .nosync dir and symlink.
             nosync_path: The .nosync directory path.
             original_name: Expected symlink name (without .nosync suffix).
+            entries: Listing of ``parent`` by name, taken by verify_and_repair.
 
         Returns:
             RepairResult if an action was taken, None if the symlink is healthy.
         """
         # Clean up all iCloud conflict symlinks (e.g. ".venv 2", ".venv 3", etc.)
-        self._remove_conflict_symlinks(parent, original_name)
+        self._remove_conflict_symlinks(original_name, entries)
 
         symlink_path = parent / original_name
+        existing = entries.get(original_name)
 
         # Healthy: valid symlink pointing to the correct target
-        if symlink_path.is_symlink():
+        if existing is not None and existing.is_symlink():
             target = symlink_path.readlink()
             if target == Path(nosync_path.name):
                 return None
@@ -344,7 +392,7 @@ class NosyncManager:
                 )
 
         # Real directory at the original name -- don't touch it
-        if symlink_path.exists():
+        if existing is not None:
             self.logger.warning(
                 "Real directory exists at symlink location: %s",
                 symlink_path,
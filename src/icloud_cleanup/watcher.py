@@ -3,12 +3,12 @@
 from __future__ import annotations
 
 import logging
+import os
 import threading
 from pathlib import Path
 from typing import TYPE_CHECKING, Any
 
 from watchdog.events import FileCreatedEvent, FileMovedEvent, FileSystemEventHandler
-from watchdog.observers import Observer
 
 # watchdog.observers.Observer is a dynamic ObserverType, not valid in type annotations
 _ObserverType = Any
@@ -34,14 +34,12 @@ class ConflictEventHandler(FileSystemEventHandler):
     def on_created(self, event: FileSystemEvent) -> None:
         """Enqueue the source path of non-directory creation events."""
         if isinstance(event, FileCreatedEvent) and not event.is_directory:
-            src_path = event.src_path if isinstance(event.src_path, str) else event.src_path.decode()
-            self._watcher.enqueue_path(Path(src_path))
+            self._watcher.enqueue_path(Path(os.fsdecode(event.src_path)))
 
     def on_moved(self, event: FileSystemEvent) -> None:
         """Enqueue the destination path of non-directory move events."""
         if isinstance(event, FileMovedEvent) and not event.is_directory:
-            dest_path = event.dest_path if isinstance(event.dest_path, str) else event.dest_path.decode()
-            self._watcher.enqueue_path(Path(dest_path))
+            self._watcher.enqueue_path(Path(os.fsdecode(event.dest_path)))
 
 
 class FileWatcher:
@@ -80,6 +78,10 @@ class FileWatcher:
         if self._observer is not None:
             return
 
+        # Deferred: importing watchdog.observers probes platform backends, which
+        # one-shot CLI commands that never watch should not pay for
+        from watchdog.observers import Observer
+
         self._observer = Observer()
         handler = ConflictEventHandler(self, self.logger)
 
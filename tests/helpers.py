@@ -0,0 +1,43 @@
+"""Shared test helpers."""
+
+from __future__ import annotations
+
+import os
+from typing import TYPE_CHECKING, TypeGuard
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    from icloud_cleanup.modules.base import CleanupModule
+
+# Members checked by is_cleanup_module(), mirroring the CleanupModule protocol
+_MODULE_ATTRIBUTES = ("MODULE_ENABLED", "name", "supports_watch")
+_MODULE_METHODS = ("can_match", "is_target", "scan_directory")
+
+
+def mkfiles(base: Path, *names: str) -> list[Path]:
+    """Create empty files under ``base`` without the extra ``utime`` call of ``Path.touch``."""
+    paths = [base / name for name in names]
+    for path in paths:
+        os.close(os.open(path, os.O_CREAT | os.O_WRONLY | os.O_CLOEXEC, 0o600))
+    return paths
+
+
+def mktree(base: Path, spec: dict[str, list[str]]) -> None:
+    """Create each relative directory in ``spec`` (with parents) and its listed empty files."""
+    for rel_dir, names in spec.items():
+        directory = base / rel_dir
+        os.makedirs(directory, exist_ok=True)
+        mkfiles(directory, *names)
+
+
+def is_cleanup_module(obj: object) -> TypeGuard[CleanupModule]:
+    """Structural CleanupModule check with plain attribute lookups.
+
+    Equivalent to ``isinstance(obj, CleanupModule)`` but skips the
+    runtime-checkable Protocol machinery, which is many times slower than
+    an ordinary isinstance().
+    """
+    return all(hasattr(obj, attr) for attr in _MODULE_ATTRIBUTES) and all(
+        callable(getattr(obj, method, None)) for method in _MODULE_METHODS
+    )
@@ -32,6 +32,14 @@ class TestCanMatch:
         assert module.can_match(".coverage") is False
         assert module.can_match("main.py") is False
 
+    def test_requires_full_name_match(self, module: CoverageArtifactsModule) -> None:
+        """Test that a trailing newline does not satisfy the pattern."""
+        assert module.can_match(".coverage.hostname.pid123.abc\n") is False
+
+    def test_requires_coverage_prefix(self, module: CoverageArtifactsModule) -> None:
+        """Test that names merely containing the pattern are rejected."""
+        assert module.can_match("x.coverage.hostname.pid123.abc") is False
+
     def test_supports_watch_is_false(self, module: CoverageArtifactsModule) -> None:
         """Verify supports_watch is False (can_match not called by watcher in practice)."""
         assert module.supports_watch is False
@@ -3,8 +3,11 @@
 from __future__ import annotations
 
 import asyncio
+from dataclasses import replace
+from errno import EDEADLK
 from pathlib import Path
-from unittest.mock import AsyncMock, patch
+from typing import NoReturn
+from unittest.mock import AsyncMock, Mock
 
 import pytest
 
@@ -13,6 +16,18 @@ from icloud_cleanup.config import CleanupConfig
 from icloud_cleanup.daemon import ICloudCleanupDaemon
 from icloud_cleanup.detector import ConflictFile
 
+from .helpers import mkfiles, mktree
+
+# Frozen loop time used by the daemon fixture's clock
+NOW = 1_000_000.0
+
+_EDEADLK_ERR_STR = f"[Errno {EDEADLK}] Resource deadlock avoided"
+
+
+def _raise_permission(*_args: object, **_kwargs: object) -> NoReturn:
+    """Stand-in for filesystem calls that always fail with ``PermissionError``."""
+    raise PermissionError("denied")
+
 
 @pytest.fixture
 def config(tmp_path: Path) -> CleanupConfig:
@@ -27,20 +42,41 @@ def config(tmp_path: Path) -> CleanupConfig:
 
 @pytest.fixture
 def daemon(config: CleanupConfig) -> ICloudCleanupDaemon:
-    """Create a daemon instance."""
-    return ICloudCleanupDaemon(config)
+    """Create a daemon instance with a frozen clock."""
+    instance = ICloudCleanupDaemon(config)
+    instance._clock = lambda: NOW
+    return instance
 
 
-def _make_conflict(path: Path) -> ConflictFile:
-    """Create a ``ConflictFile`` object for testing."""
+@pytest.fixture
+def guardian_daemon(request: pytest.FixtureRequest, tmp_path: Path) -> ICloudCleanupDaemon:
+    """Create a daemon watching ``tmp_path``; indirect param sets ``nosync_auto_repair`` (default True)."""
+    cfg = CleanupConfig(
+        watch_directories=[tmp_path],
+        nosync_auto_repair=getattr(request, "param", True),
+        log_file=tmp_path / "test.log",
+        recovery_dir=tmp_path / "recovery",
+    )
+    return ICloudCleanupDaemon(cfg)
+
+
+@pytest.fixture(scope="session")
+def conflict_template() -> ConflictFile:
+    """Prebuilt ``document 2.txt`` conflict; tests swap in their own path via ``replace``."""
     return ConflictFile(
-        path=path,
-        original_name=path.stem.rsplit(" ", 1)[0],
+        path=Path("document 2.txt"),
+        original_name="document",
         conflict_number=2,
-        extension=path.suffix or None,
+        extension=".txt",
     )
 
 
+def _stub_sync_and_delete(daemon: ICloudCleanupDaemon, result: CleanupResult) -> None:
+    """Replace the sync wait and conflict deletion with plain mocks returning ``result``."""
+    daemon.checker.wait_for_sync = AsyncMock(return_value=True)
+    daemon.cleaner.delete_conflict = Mock(return_value=result)
+
+
 class TestDaemonInit:
     """Tests for daemon initialization."""
 
@@ -56,6 +92,19 @@ class TestDaemonInit:
         """Test that retry_cooldown is read from config."""
         assert daemon.config.retry_cooldown == 3600
 
+    def test_nosync_manager_initialized(self, daemon: ICloudCleanupDaemon) -> None:
+        """Verify that the daemon initializes a NosyncManager."""
+        assert hasattr(daemon, "nosync_manager")
+        from icloud_cleanup.nosync import NosyncManager
+
+        assert isinstance(daemon.nosync_manager, NosyncManager)
+
+    @pytest.mark.asyncio
+    async def test_clock_defaults_to_loop_time(self, config: CleanupConfig) -> None:
+        """Test that the default clock reads the running event loop time."""
+        instance = ICloudCleanupDaemon(config)
+        assert instance._clock() <= asyncio.get_running_loop().time()
+
 
 class TestLogLevelValidation:
     """Tests for log_level validation in daemon init."""
@@ -74,36 +123,32 @@ class TestLogLevelValidation:
 class TestRetryLimit:
     """Tests for retry limit functionality."""
 
-    @pytest.mark.asyncio
-    async def test_skips_during_cooldown(self, daemon: ICloudCleanupDaemon, tmp_path: Path) -> None:
+    pytestmark = pytest.mark.asyncio(loop_scope="class")
+
+    async def test_skips_during_cooldown(
+        self, daemon: ICloudCleanupDaemon, conflict_template: ConflictFile, tmp_path: Path
+    ) -> None:
         """Test that files are skipped during the cooldown period."""
-        conflict_file = tmp_path / "document 2.txt"
-        conflict_file.touch()
-        original = tmp_path / "document.txt"
-        original.touch()
-        conflict = _make_conflict(conflict_file)
+        conflict_file, _original = mkfiles(tmp_path, "document 2.txt", "document.txt")
+        conflict = replace(conflict_template, path=conflict_file)
 
         # Simulate max retries reached recently (within cooldown)
-        current_time = asyncio.get_running_loop().time()
-        daemon._failed_deletes[conflict_file] = (3, current_time - 100)  # 100s ago
+        daemon._failed_deletes[conflict_file] = (3, NOW - 100)  # 100s ago
 
         result = await daemon._process_conflict(conflict)
 
         assert result is None
         assert daemon.stats.files_skipped == 1
 
-    @pytest.mark.asyncio
-    async def test_retries_after_cooldown_expires(self, daemon: ICloudCleanupDaemon, tmp_path: Path) -> None:
+    async def test_retries_after_cooldown_expires(
+        self, daemon: ICloudCleanupDaemon, conflict_template: ConflictFile, tmp_path: Path
+    ) -> None:
         """Test that files are retried after cooldown expires."""
-        conflict_file = tmp_path / "document 2.txt"
-        conflict_file.touch()
-        original = tmp_path / "document.txt"
-        original.touch()
-        conflict = _make_conflict(conflict_file)
+        conflict_file, _original = mkfiles(tmp_path, "document 2.txt", "document.txt")
+        conflict = replace(conflict_template, path=conflict_file)
 
         # Simulate max retries reached long ago (cooldown expired)
-        current_time = asyncio.get_running_loop().time()
-        daemon._failed_deletes[conflict_file] = (3, current_time - 4000)
+        daemon._failed_deletes[conflict_file] = (3, NOW - 4000)
 
         success_result = CleanupResult(
             path=conflict_file,
@@ -111,24 +156,19 @@ class TestRetryLimit:
             action="deleted",
         )
 
-        with (
-            patch.object(daemon.checker, "wait_for_sync", new=AsyncMock(return_value=True)),
-            patch.object(daemon.cleaner, "delete_conflict", return_value=success_result),
-        ):
-            result = await daemon._process_conflict(conflict)
+        _stub_sync_and_delete(daemon, success_result)
+        result = await daemon._process_conflict(conflict)
 
         assert result is not None
         assert result.success is True
         assert conflict_file not in daemon._failed_deletes
 
-    @pytest.mark.asyncio
-    async def test_increments_failure_count(self, daemon: ICloudCleanupDaemon, tmp_path: Path) -> None:
+    async def test_increments_failure_count(
+        self, daemon: ICloudCleanupDaemon, conflict_template: ConflictFile, tmp_path: Path
+    ) -> None:
         """Test that failure count is incremented on failed deletion."""
-        conflict_file = tmp_path / "document 2.txt"
-        conflict_file.touch()
-        original = tmp_path / "document.txt"
-        original.touch()
-        conflict = _make_conflict(conflict_file)
+        conflict_file, _original = mkfiles(tmp_path, "document 2.txt", "document.txt")
+        conflict = replace(conflict_template, path=conflict_file)
 
         failed_result = CleanupResult(
             path=conflict_file,
@@ -137,29 +177,23 @@ class TestRetryLimit:
             error="Resource deadlock avoided",
         )
 
-        with (
-            patch.object(daemon.checker, "wait_for_sync", new=AsyncMock(return_value=True)),
-            patch.object(daemon.cleaner, "delete_conflict", return_value=failed_result),
-        ):
-            await daemon._process_conflict(conflict)
+        _stub_sync_and_delete(daemon, failed_result)
+        await daemon._process_conflict(conflict)
 
         assert conflict_file in daemon._failed_deletes
         failure_count, _ = daemon._failed_deletes[conflict_file]
         assert failure_count == 1
         assert daemon.stats.errors == 1
 
-    @pytest.mark.asyncio
-    async def test_clears_failure_on_success(self, daemon: ICloudCleanupDaemon, tmp_path: Path) -> None:
+    async def test_clears_failure_on_success(
+        self, daemon: ICloudCleanupDaemon, conflict_template: ConflictFile, tmp_path: Path
+    ) -> None:
         """Test that failure count is cleared on successful deletion."""
-        conflict_file = tmp_path / "document 2.txt"
-        conflict_file.touch()
-        original = tmp_path / "document.txt"
-        original.touch()
-        conflict = _make_conflict(conflict_file)
+        conflict_file, _original = mkfiles(tmp_path, "document 2.txt", "document.txt")
+        conflict = replace(conflict_template, path=conflict_file)
 
         # Pre-populate failure count (not yet at max)
-        current_time = asyncio.get_running_loop().time()
-        daemon._failed_deletes[conflict_file] = (2, current_time - 10)
+        daemon._failed_deletes[conflict_file] = (2, NOW - 10)
 
         success_result = CleanupResult(
             path=conflict_file,
@@ -167,27 +201,21 @@ class TestRetryLimit:
             action="deleted",
         )
 
-        with (
-            patch.object(daemon.checker, "wait_for_sync", new=AsyncMock(return_value=True)),
-            patch.object(daemon.cleaner, "delete_conflict", return_value=success_result),
-        ):
-            await daemon._process_conflict(conflict)
+        _stub_sync_and_delete(daemon, success_result)
+        await daemon._process_conflict(conflict)
 
         assert conflict_file not in daemon._failed_deletes
         assert daemon.stats.files_deleted == 1
 
-    @pytest.mark.asyncio
-    async def test_allows_retries_under_limit(self, daemon: ICloudCleanupDaemon, tmp_path: Path) -> None:
+    async def test_allows_retries_under_limit(
+        self, daemon: ICloudCleanupDaemon, conflict_template: ConflictFile, tmp_path: Path
+    ) -> None:
         """Test that files under retry limit are still processed."""
-        conflict_file = tmp_path / "document 2.txt"
-        conflict_file.touch()
-        original = tmp_path / "document.txt"
-        original.touch()
-        conflict = _make_conflict(conflict_file)
+        conflict_file, _original = mkfiles(tmp_path, "document 2.txt", "document.txt")
+        conflict = replace(conflict_template, path=conflict_file)
 
         # Set failure count below limit
-        current_time = asyncio.get_running_loop().time()
-        daemon._failed_deletes[conflict_file] = (2, current_time - 10)
+        daemon._failed_deletes[conflict_file] = (2, NOW - 10)
 
         failed_result = CleanupResult(
             path=conflict_file,
@@ -196,31 +224,23 @@ class TestRetryLimit:
             error="Resource deadlock avoided",
         )
 
-        with (
-            patch.object(daemon.checker, "wait_for_sync", new=AsyncMock(return_value=True)),
-            patch.object(daemon.cleaner, "delete_conflict", return_value=failed_result),
-        ):
-            result = await daemon._process_conflict(conflict)
+        _stub_sync_and_delete(daemon, failed_result)
+        result = await daemon._process_conflict(conflict)
 
         assert result is not None
         assert result.success is False
         failure_count, _ = daemon._failed_deletes[conflict_file]
         assert failure_count == 3
 
-    @pytest.mark.asyncio
     async def test_failure_resets_after_cooldown_then_fails_again(
-        self, daemon: ICloudCleanupDaemon, tmp_path: Path
+        self, daemon: ICloudCleanupDaemon, conflict_template: ConflictFile, tmp_path: Path
     ) -> None:
         """Test that counter resets after cooldown and tracks new failures."""
-        conflict_file = tmp_path / "document 2.txt"
-        conflict_file.touch()
-        original = tmp_path / "document.txt"
-        original.touch()
-        conflict = _make_conflict(conflict_file)
+        conflict_file, _original = mkfiles(tmp_path, "document 2.txt", "document.txt")
+        conflict = replace(conflict_template, path=conflict_file)
 
         # Simulate max retries reached long ago (cooldown expired)
-        current_time = asyncio.get_running_loop().time()
-        daemon._failed_deletes[conflict_file] = (3, current_time - 4000)
+        daemon._failed_deletes[conflict_file] = (3, NOW - 4000)
 
         failed_result = CleanupResult(
             path=conflict_file,
@@ -229,11 +249,8 @@ class TestRetryLimit:
             error="Resource deadlock avoided",
         )
 
-        with (
-            patch.object(daemon.checker, "wait_for_sync", new=AsyncMock(return_value=True)),
-            patch.object(daemon.cleaner, "delete_conflict", return_value=failed_result),
-        ):
-            await daemon._process_conflict(conflict)
+        _stub_sync_and_delete(daemon, failed_result)
+        await daemon._process_conflict(conflict)
 
         # Counter should have reset and started from 1
         failure_count, _ = daemon._failed_deletes[conflict_file]
@@ -254,8 +271,7 @@ class TestGuardianCycleCounter:
         config.recovery_dir = tmp_path / "recovery"
         daemon = ICloudCleanupDaemon(config)
 
-        nosync = tmp_path / ".venv.nosync"
-        nosync.mkdir()
+        mktree(tmp_path, {".venv.nosync": []})
 
         daemon._scan_and_queue()
 
@@ -278,8 +294,7 @@ class TestGuardianCycleCounter:
         assert daemon._guardian_cycle_count == 1
 
         # Create a new broken symlink after the first scan
-        nosync = tmp_path / "node_modules.nosync"
-        nosync.mkdir()
+        mktree(tmp_path, {"node_modules.nosync": []})
 
         # Second call (cycle 1) — guardian skipped
         daemon._scan_and_queue()
@@ -305,130 +320,63 @@ class TestGuardianCycleCounter:
 class TestSymlinkGuardianIntegration:
     """Tests for symlink guardian in daemon."""
 
-    @pytest.mark.asyncio
-    async def test_scan_calls_verify_and_repair(self, tmp_path: Path) -> None:
-        """Verify that _scan_and_queue repairs broken symlinks when auto_repair is on."""
-        config = CleanupConfig()
-        config.watch_directories = [tmp_path]
-        config.nosync_auto_repair = True
-        config.log_file = tmp_path / "test.log"
-        config.recovery_dir = tmp_path / "recovery"
-        daemon = ICloudCleanupDaemon(config)
-
-        nosync = tmp_path / ".venv.nosync"
-        nosync.mkdir()
-
-        daemon._scan_and_queue()
-
-        link = tmp_path / ".venv"
-        assert link.is_symlink()
-
-    @pytest.mark.asyncio
-    async def test_scan_skips_repair_when_disabled(self, tmp_path: Path) -> None:
-        """Verify that _scan_and_queue skips symlink repair when auto_repair is off."""
-        config = CleanupConfig()
-        config.watch_directories = [tmp_path]
-        config.nosync_auto_repair = False
-        config.log_file = tmp_path / "test.log"
-        config.recovery_dir = tmp_path / "recovery"
-        daemon = ICloudCleanupDaemon(config)
+    pytestmark = pytest.mark.asyncio(loop_scope="class")
 
-        nosync = tmp_path / ".venv.nosync"
-        nosync.mkdir()
+    @pytest.mark.parametrize("guardian_daemon", [True, False], indirect=True)
+    async def test_scan_repairs_only_when_auto_repair_enabled(
+        self, guardian_daemon: ICloudCleanupDaemon, tmp_path: Path
+    ) -> None:
+        """Verify that _scan_and_queue repairs broken symlinks only when auto_repair is on."""
+        mktree(tmp_path, {".venv.nosync": []})
 
-        daemon._scan_and_queue()
+        guardian_daemon._scan_and_queue()
 
         link = tmp_path / ".venv"
-        assert not link.exists()
+        assert link.is_symlink() is guardian_daemon.config.nosync_auto_repair
 
-    @pytest.mark.asyncio
-    async def test_scan_recurses_into_subdirectories(self, tmp_path: Path) -> None:
+    async def test_scan_recurses_into_subdirectories(
+        self, guardian_daemon: ICloudCleanupDaemon, tmp_path: Path
+    ) -> None:
         """Verify that the guardian walks subdirectories for broken symlinks."""
-        config = CleanupConfig()
-        config.watch_directories = [tmp_path]
-        config.nosync_auto_repair = True
-        config.log_file = tmp_path / "test.log"
-        config.recovery_dir = tmp_path / "recovery"
-        daemon = ICloudCleanupDaemon(config)
+        mktree(tmp_path, {"project/node_modules.nosync": []})
 
-        subdir = tmp_path / "project"
-        subdir.mkdir()
-        nosync = subdir / "node_modules.nosync"
-        nosync.mkdir()
+        guardian_daemon._scan_and_queue()
 
-        daemon._scan_and_queue()
-
-        link = subdir / "node_modules"
+        link = tmp_path / "project" / "node_modules"
         assert link.is_symlink()
 
-    @pytest.mark.asyncio
-    async def test_scan_skips_nosync_directories(self, tmp_path: Path) -> None:
+    async def test_scan_skips_nosync_directories(self, guardian_daemon: ICloudCleanupDaemon, tmp_path: Path) -> None:
         """Verify that the guardian does not recurse into .nosync directories."""
-        config = CleanupConfig()
-        config.watch_directories = [tmp_path]
-        config.nosync_auto_repair = True
-        config.log_file = tmp_path / "test.log"
-        config.recovery_dir = tmp_path / "recovery"
-        daemon = ICloudCleanupDaemon(config)
-
         # Create a .nosync dir with a nested .nosync inside (should not be visited)
-        outer = tmp_path / "libs.nosync"
-        outer.mkdir()
-        inner = outer / ".venv.nosync"
-        inner.mkdir()
+        mktree(tmp_path, {"libs.nosync/.venv.nosync": []})
 
-        daemon._scan_and_queue()
+        guardian_daemon._scan_and_queue()
 
         # The inner .venv symlink should NOT be created (we skip .nosync dirs)
-        inner_link = outer / ".venv"
+        inner_link = tmp_path / "libs.nosync" / ".venv"
         assert not inner_link.exists()
 
-    @pytest.mark.asyncio
-    async def test_scan_skips_symlink_directories(self, tmp_path: Path) -> None:
+    async def test_scan_skips_symlink_directories(self, guardian_daemon: ICloudCleanupDaemon, tmp_path: Path) -> None:
         """Verify that the guardian does not follow symlinks when recursing."""
-        config = CleanupConfig()
-        config.watch_directories = [tmp_path]
-        config.nosync_auto_repair = True
-        config.log_file = tmp_path / "test.log"
-        config.recovery_dir = tmp_path / "recovery"
-        daemon = ICloudCleanupDaemon(config)
-
         # Create a symlink to a directory
+        mktree(tmp_path, {"real_project/.venv.nosync": []})
         real_dir = tmp_path / "real_project"
-        real_dir.mkdir()
-        nosync_inside = real_dir / ".venv.nosync"
-        nosync_inside.mkdir()
 
         sym_dir = tmp_path / "sym_project"
         sym_dir.symlink_to(real_dir)
 
-        daemon._scan_and_queue()
+        guardian_daemon._scan_and_queue()
 
         # The .venv symlink should be created in real_project (direct child)
         assert (real_dir / ".venv").is_symlink()
         # But NOT via the symlink path (we skip symlink dirs)
         # The real_project one is created via direct recursion, not via sym_project
 
-    @pytest.mark.asyncio
-    async def test_scan_handles_permission_error(self, tmp_path: Path) -> None:
+    async def test_scan_handles_permission_error(self, guardian_daemon: ICloudCleanupDaemon) -> None:
         """Verify that PermissionError during a guardian walk is caught."""
-        config = CleanupConfig()
-        config.watch_directories = [tmp_path]
-        config.nosync_auto_repair = True
-        config.log_file = tmp_path / "test.log"
-        config.recovery_dir = tmp_path / "recovery"
-        daemon = ICloudCleanupDaemon(config)
-
         # Should not raise even if directory listing fails
-        with patch.object(daemon.nosync_manager, "verify_and_repair", side_effect=PermissionError("denied")):
-            daemon._scan_and_queue()  # must not raise
-
-    def test_nosync_manager_initialized(self, daemon: ICloudCleanupDaemon) -> None:
-        """Verify that the daemon initializes a NosyncManager."""
-        assert hasattr(daemon, "nosync_manager")
-        from icloud_cleanup.nosync import NosyncManager
-
-        assert isinstance(daemon.nosync_manager, NosyncManager)
+        guardian_daemon.nosync_manager.verify_and_repair = _raise_permission
+        guardian_daemon._scan_and_queue()  # must not raise
 
 
 class TestEDEADLKRetry:
@@ -436,8 +384,6 @@ class TestEDEADLKRetry:
 
     def test_edeadlk_not_counted(self, tmp_path: Path) -> None:
         """Verify EDEADLK errors are treated as transient and not counted."""
-        import errno as errno_mod
-
         config = CleanupConfig()
         config.watch_directories = [tmp_path]
         config.log_file = tmp_path / "test.log"
@@ -449,7 +395,7 @@ class TestEDEADLKRetry:
             path=path,
             success=False,
             action="error",
-            error=f"[Errno {errno_mod.EDEADLK}] Resource deadlock avoided",
+            error=_EDEADLK_ERR_STR,
         )
 
         daemon._update_stats_after_delete(path, edeadlk_result, 0, 100.0)
@@ -480,8 +426,6 @@ class TestEDEADLKRetry:
 
     def test_edeadlk_does_not_reset_existing_failures(self, tmp_path: Path) -> None:
         """Verify EDEADLK does not alter pre-existing failure tracking for the path."""
-        import errno as errno_mod
-
         config = CleanupConfig()
         config.watch_directories = [tmp_path]
         config.log_file = tmp_path / "test.log"
@@ -496,7 +440,7 @@ class TestEDEADLKRetry:
             path=path,
             success=False,
             action="error",
-            error=f"[Errno {errno_mod.EDEADLK}] Resource deadlock avoided",
+            error=_EDEADLK_ERR_STR,
         )
 
         daemon._update_stats_after_delete(path, edeadlk_result, 1, 100.0)
@@ -520,10 +464,7 @@ class TestWatcherBatchProcessing:
         config.recovery_dir = tmp_path / "recovery"
         daemon = ICloudCleanupDaemon(config)
 
-        original = tmp_path / "document.txt"
-        original.touch()
-        conflict = tmp_path / "document 2.txt"
-        conflict.touch()
+        _original, conflict = mkfiles(tmp_path, "document.txt", "document 2.txt")
 
         daemon._check_and_enqueue(conflict)
 
@@ -538,8 +479,7 @@ class TestWatcherBatchProcessing:
         config.recovery_dir = tmp_path / "recovery"
         daemon = ICloudCleanupDaemon(config)
 
-        regular = tmp_path / "document.txt"
-        regular.touch()
+        (regular,) = mkfiles(tmp_path, "document.txt")
 
         daemon._check_and_enqueue(regular)
 
@@ -554,10 +494,7 @@ class TestWatcherBatchProcessing:
         config.recovery_dir = tmp_path / "recovery"
         daemon = ICloudCleanupDaemon(config)
 
-        original = tmp_path / "document.txt"
-        original.touch()
-        conflict = tmp_path / "document 2.txt"
-        conflict.touch()
+        _original, conflict = mkfiles(tmp_path, "document.txt", "document 2.txt")
 
         # Pre-populate pending
         daemon._pending_deletes[conflict] = (100.0, None)
@@ -578,13 +515,8 @@ class TestWatcherBatchProcessing:
         config.watcher_batch_size = 2
         daemon = ICloudCleanupDaemon(config)
 
-        conflicts = []
-        for i in range(5):
-            orig = tmp_path / f"doc{i}.txt"
-            orig.touch()
-            conflict = tmp_path / f"doc{i} 2.txt"
-            conflict.touch()
-            conflicts.append(conflict)
+        mkfiles(tmp_path, *(f"doc{i}.txt" for i in range(5)))
+        conflicts = mkfiles(tmp_path, *(f"doc{i} 2.txt" for i in range(5)))
 
         await daemon._process_watcher_batch(set(conflicts))
 
@@ -594,18 +526,13 @@ class TestWatcherBatchProcessing:
     @pytest.mark.asyncio
     async def test_check_and_enqueue_handles_edeadlk(self, tmp_path: Path) -> None:
         """Verify that EDEADLK during is_target is caught and skipped."""
-        import errno as errno_mod
-
         config = CleanupConfig()
         config.watch_directories = [tmp_path]
         config.log_file = tmp_path / "test.log"
         config.recovery_dir = tmp_path / "recovery"
         daemon = ICloudCleanupDaemon(config)
 
-        conflict = tmp_path / "document 2.txt"
-        conflict.touch()
-        original = tmp_path / "document.txt"
-        original.touch()
+        conflict, _original = mkfiles(tmp_path, "document 2.txt", "document.txt")
 
         # Patch is_target to raise EDEADLK
         for module in daemon._watch_modules:
@@ -615,7 +542,7 @@ class TestWatcherBatchProcessing:
                 with mock_patch.object(
                     module,
                     "is_target",
-                    side_effect=OSError(errno_mod.EDEADLK, "Resource deadlock avoided"),
+                    side_effect=OSError(EDEADLK, "Resource deadlock avoided"),
                 ):
                     daemon._check_and_enqueue(conflict)
                 break
@@ -7,6 +7,8 @@ import pytest
 from icloud_cleanup.config import CleanupConfig
 from icloud_cleanup.detector import ConflictDetector
 
+from .helpers import mkfiles, mktree
+
 
 @pytest.fixture
 def config() -> CleanupConfig:
@@ -20,6 +22,13 @@ def detector(config: CleanupConfig) -> ConflictDetector:
     return ConflictDetector(config)
 
 
+@pytest.fixture
+def assume_files(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Treat every path as an existing regular file so pattern tests need no real files."""
+    monkeypatch.setattr(Path, "is_file", lambda _self: True)
+
+
+@pytest.mark.usefixtures("assume_files")
 class TestConflictPattern:
     """Tests for conflict file pattern matching."""
 
@@ -42,15 +51,12 @@ class TestConflictPattern:
     def test_detects_conflict_files(
         self,
         detector: ConflictDetector,
-        tmp_path: Path,
         filename: str,
         expected_original: str,
         expected_num: int,
     ) -> None:
         """Test that conflict files are detected correctly."""
-        # Create test file
-        test_file = tmp_path / filename
-        test_file.touch()
+        test_file = Path(filename)
 
         conflict = detector.is_conflict_file(test_file)
 
@@ -78,12 +84,10 @@ class TestConflictPattern:
     def test_ignores_non_conflict_files(
         self,
         detector: ConflictDetector,
-        tmp_path: Path,
         filename: str,
     ) -> None:
         """Test that regular files are not detected as conflicts."""
-        test_file = tmp_path / filename
-        test_file.touch()
+        test_file = Path(filename)
 
         conflict = detector.is_conflict_file(test_file)
 
@@ -100,10 +104,7 @@ class TestDirectoryScan:
     ) -> None:
         """Test that scan finds conflict files in directory."""
         # Create original and conflict files
-        (tmp_path / "document.txt").touch()
-        (tmp_path / "document 2.txt").touch()
-        (tmp_path / "document 3.txt").touch()
-        (tmp_path / "other.csv").touch()
+        mkfiles(tmp_path, "document.txt", "document 2.txt", "document 3.txt", "other.csv")
 
         conflicts = detector.scan_directory(tmp_path)
 
@@ -136,7 +137,4 @@ class TestDirectoryScan:
 
 def _setup_nested_conflicts(tmp_path: Path) -> None:
     """Create nested directory structure with conflict files."""
-    subdir = tmp_path / "subdir"
-    subdir.mkdir()
-    (tmp_path / "root 2.txt").touch()
-    (subdir / "nested 2.txt").touch()
+    mktree(tmp_path, {".": ["root 2.txt"], "subdir": ["nested 2.txt"]})
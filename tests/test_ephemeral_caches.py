@@ -2,11 +2,13 @@
 
 from __future__ import annotations
 
+import os
 from pathlib import Path
 
 import pytest
 
 from icloud_cleanup.config import CleanupConfig
+from icloud_cleanup.modules import scan_all_modules
 from icloud_cleanup.modules.base import DetectedFile
 from icloud_cleanup.modules.ephemeral_caches import EphemeralCachesModule
 
@@ -142,6 +144,28 @@ class TestIsTarget:
 
         assert result is None
 
+    def test_ignores_symlink_to_directory(self, module: EphemeralCachesModule, tmp_path: Path) -> None:
+        """Ignores a symlink named like a cache (e.g. build -> build.nosync)."""
+        real = _make_cache_dir(tmp_path, "build.nosync")
+        link = tmp_path / "build"
+        link.symlink_to(real.name)
+
+        result = module.is_target(link)
+
+        assert result is None
+
+    def test_is_target_entry_matches_is_target(self, module: EphemeralCachesModule, tmp_path: Path) -> None:
+        """The scandir entry variant agrees with is_target for caches, files, and plain dirs."""
+        _make_cache_dir(tmp_path, "__pycache__")
+        _make_cache_dir(tmp_path, "src")
+        (tmp_path / "dist").touch()
+
+        with os.scandir(tmp_path) as entries:
+            results = {entry.name: module.is_target_entry(entry) for entry in entries}
+
+        assert {name for name, result in results.items() if result} == {"__pycache__"}
+        assert results["__pycache__"] == module.is_target(tmp_path / "__pycache__")
+
     def test_ignores_regular_directory(self, module: EphemeralCachesModule, tmp_path: Path) -> None:
         """Ignores directories that do not match any ephemeral pattern."""
         src = _make_cache_dir(tmp_path, "src")
@@ -170,7 +194,7 @@ class TestScanDirectory:
         # Non-cache directory should not be detected
         _make_cache_dir(tmp_path, "src")
 
-        detected = module.scan_directory(tmp_path)
+        detected = list(module.scan_directory(tmp_path))
 
         found_names = {d.path.name for d in detected}
         assert found_names == {".mypy_cache", "__pycache__", ".pytest_cache"}
@@ -181,7 +205,7 @@ class TestScanDirectory:
         project_src.mkdir(parents=True)
         _make_cache_dir(project_src, "__pycache__")
 
-        detected = module.scan_directory(tmp_path)
+        detected = list(module.scan_directory(tmp_path))
 
         assert len(detected) == 1
         assert detected[0].path == project_src / "__pycache__"
@@ -191,7 +215,29 @@ class TestScanDirectory:
         venv_nosync = _make_cache_dir(tmp_path, ".venv.nosync")
         _make_cache_dir(venv_nosync / "lib", "__pycache__")
 
-        detected = module.scan_directory(tmp_path)
+        detected = list(module.scan_directory(tmp_path))
+
+        assert detected == []
+
+    @pytest.mark.parametrize("pruned", [".git", ".venv", "node_modules"])
+    def test_does_not_descend_into_pruned_directories(
+        self, module: EphemeralCachesModule, tmp_path: Path, pruned: str
+    ) -> None:
+        """Valuable and VCS directories are never walked for caches."""
+        _make_cache_dir(tmp_path / pruned / "pkg", "__pycache__")
+
+        detected = list(module.scan_directory(tmp_path))
+
+        assert detected == []
+
+    def test_custom_valuable_patterns_are_pruned(self, tmp_path: Path) -> None:
+        """User-configured valuable patterns are pruned like the built-ins."""
+        cleanup_config = CleanupConfig()
+        cleanup_config.nosync_valuable_patterns = ["*.vendor"]
+        module = EphemeralCachesModule(cleanup_config)
+        _make_cache_dir(tmp_path / "deps.vendor", "__pycache__")
+
+        detected = list(module.scan_directory(tmp_path))
 
         assert detected == []
 
@@ -204,19 +250,40 @@ class TestScanDirectory:
         build = _make_cache_dir(tmp_path, "build")
         _make_cache_dir(build / "lib", "__pycache__")
 
-        detected = module.scan_directory(tmp_path)
+        detected = list(module.scan_directory(tmp_path))
 
         assert len(detected) == 1
         assert detected[0].path == build
 
+    def test_does_not_descend_into_symlinked_directories(self, module: EphemeralCachesModule, tmp_path: Path) -> None:
+        """Caches behind a symlinked directory are only reported via the real path."""
+        real = tmp_path / "real"
+        _make_cache_dir(real, "__pycache__")
+        (tmp_path / "alias").symlink_to(real)
+
+        detected = list(module.scan_directory(tmp_path))
+
+        assert [d.path for d in detected] == [real / "__pycache__"]
+
     def test_nonexistent_directory(self, module: EphemeralCachesModule, tmp_path: Path) -> None:
         """Scanning a nonexistent directory returns an empty list."""
         nonexistent = tmp_path / "does_not_exist"
 
-        detected = module.scan_directory(nonexistent)
+        detected = list(module.scan_directory(nonexistent))
 
         assert detected == []
 
+    def test_scan_is_lazy(self, module: EphemeralCachesModule, tmp_path: Path) -> None:
+        """scan_directory streams results instead of materializing a list."""
+        _make_cache_dir(tmp_path, "__pycache__")
+        _make_cache_dir(tmp_path / "pkg", "__pycache__")
+
+        detected = module.scan_directory(tmp_path)
+
+        assert not isinstance(detected, list)
+        first = next(iter(detected))
+        assert first.path.name == "__pycache__"
+
 
 class TestScanAll:
     """Tests for scanning all configured watch directories."""
@@ -236,7 +303,7 @@ class TestScanAll:
         cleanup_config.watch_directories = [dir_a, dir_b]
         module = EphemeralCachesModule(cleanup_config)
 
-        detected = module.scan_all()
+        detected = scan_all_modules([module], cleanup_config.watch_directories)
 
         assert len(detected) == 3
         found_names = {d.path.name for d in detected}
@@ -275,3 +342,30 @@ class TestConfigOverrides:
 
         assert result_custom is not None
         assert result_pycache is not None
+
+    def test_reason_distinguishes_custom_patterns(self, tmp_path: Path) -> None:
+        """Built-in and custom matches carry different reasons."""
+        cleanup_config = CleanupConfig()
+        cleanup_config.nosync_ephemeral_patterns = [".custom_cache"]
+        module = EphemeralCachesModule(cleanup_config)
+
+        custom = module.is_target(_make_cache_dir(tmp_path, ".custom_cache"))
+        builtin = module.is_target(_make_cache_dir(tmp_path, "__pycache__"))
+
+        assert custom is not None
+        assert custom.reason == "Ephemeral cache directory (custom pattern): .custom_cache"
+        assert builtin is not None
+        assert builtin.reason == "Ephemeral cache directory: __pycache__"
+
+    def test_name_classification_is_memoized(self, module: EphemeralCachesModule) -> None:
+        """Repeated basenames hit the per-instance match cache."""
+        for _ in range(3):
+            module.can_match("__pycache__")
+
+        assert module._match_reason.cache_info().hits == 2
+
+    def test_nosync_names_bypass_match_cache(self, module: EphemeralCachesModule) -> None:
+        """.nosync names are rejected before any pattern work or cache entry."""
+        assert module.can_match(".mypy_cache.nosync") is False
+
+        assert module._match_reason.cache_info().currsize == 0
@@ -41,6 +41,19 @@ class TestCanMatch:
         """Test that hidden conflict files pass."""
         assert module.can_match(".hidden 2") is True
 
+    @pytest.mark.parametrize("name", ["document\t2.txt", "document\u00a02.txt"])
+    def test_matches_non_space_whitespace(self, module: ICloudConflictsModule, name: str) -> None:
+        """Test that the whitespace fast reject does not drop tab or non-ASCII separators."""
+        assert module.can_match(name) is True
+
+    def test_custom_pattern_without_whitespace(self, tmp_path: Path) -> None:
+        """Test that the whitespace fast reject only applies to the default pattern."""
+        config = CleanupConfig()
+        config.conflict_pattern = r"^(.+)_conflict(\d+)(\.[^.]+)?$"
+        module = ICloudConflictsModule(config)
+
+        assert module.can_match("document_conflict2.txt") is True
+
     def test_no_io_performed(self, module: ICloudConflictsModule) -> None:
         """Test that can_match works on pure strings without filesystem access."""
         assert module.can_match("nonexistent 2.xyz") is True
@@ -3,13 +3,15 @@
 from __future__ import annotations
 
 import subprocess
+from dataclasses import FrozenInstanceError
 from pathlib import Path
-from unittest.mock import MagicMock, patch
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
 from icloud_cleanup.config import CleanupConfig
 from icloud_cleanup.icloud_status import (
+    INITIAL_POLL_DELAY,
     FileStatus,
     ICloudStatusChecker,
     SyncStatus,
@@ -59,6 +61,18 @@ class TestFileStatus:
         assert not status.is_placeholder
         assert status.is_uploaded
 
+    def test_frozen(self, tmp_path: Path) -> None:
+        """Test FileStatus snapshots cannot be mutated."""
+        status = FileStatus(
+            path=tmp_path / "file.txt",
+            status=SyncStatus.SYNCED,
+            is_placeholder=False,
+            is_uploaded=True,
+        )
+
+        with pytest.raises(FrozenInstanceError):
+            setattr(status, "status", SyncStatus.ERROR)  # noqa: B010
+
 
 class TestGetFileStatus:
     """Tests for get_file_status method."""
@@ -84,6 +98,17 @@ class TestGetFileStatus:
         assert status.is_placeholder
         assert status.is_uploaded
 
+    def test_icloud_placeholder_skips_xattr(self, tmp_path: Path) -> None:
+        """Test placeholders are classified from the name without running xattr."""
+        placeholder = tmp_path / ".document.txt.icloud"
+        placeholder.touch()
+
+        with patch("subprocess.run") as mock_run:
+            ICloudStatusChecker.get_file_status(placeholder)
+            assert ICloudStatusChecker(CleanupConfig()).is_synced(placeholder) is False
+
+        mock_run.assert_not_called()
+
     def test_regular_file_synced(self, tmp_path: Path) -> None:
         """Test regular file without iCloud attributes is synced."""
         regular_file = tmp_path / "document.txt"
@@ -256,6 +281,40 @@ class TestWaitForSync:
 
         assert result is False
 
+    @pytest.mark.asyncio
+    async def test_backoff_starts_fast_and_caps_at_poll_interval(self, config: CleanupConfig, tmp_path: Path) -> None:
+        """Test that poll delays begin sub-second and never exceed the poll interval."""
+        config.icloud_poll_interval = 1
+        config.max_icloud_wait = 3
+        checker = ICloudStatusChecker(config)
+        sleep = AsyncMock()
+
+        with patch.object(checker, "is_synced", return_value=False), patch("asyncio.sleep", sleep):
+            result = await checker.wait_for_sync(tmp_path / "slow.txt")
+
+        delays = [call.args[0] for call in sleep.await_args_list]
+        assert result is False
+        assert delays[0] <= INITIAL_POLL_DELAY
+        assert max(delays) <= config.icloud_poll_interval
+        assert sum(delays) == pytest.approx(config.max_icloud_wait)
+
+    @pytest.mark.asyncio
+    async def test_capped_polls_use_the_configured_interval(self, config: CleanupConfig, tmp_path: Path) -> None:
+        """Test that once the backoff reaches the cap, every poll waits the full interval (no jitter)."""
+        config.icloud_poll_interval = 2
+        config.max_icloud_wait = 60
+        checker = ICloudStatusChecker(config)
+        sleep = AsyncMock()
+
+        with patch.object(checker, "is_synced", return_value=False), patch("asyncio.sleep", sleep):
+            result = await checker.wait_for_sync(tmp_path / "slow.txt")
+
+        delays = [call.args[0] for call in sleep.await_args_list]
+        capped = delays[delays.index(config.icloud_poll_interval) : -1]
+        assert result is False
+        assert len(capped) > 10
+        assert all(delay == config.icloud_poll_interval for delay in capped)
+
 
 class TestGetICloudDriveStatus:
     """Tests for get_icloud_drive_status method."""
@@ -278,6 +337,16 @@ downloads: 0"""
         assert status["account"] == "user@example.com"
         assert status["status"] == "idle"
 
+    def test_parse_brctl_output_trims_and_splits_on_first_colon(self) -> None:
+        """Test keys and values are trimmed and values may contain colons."""
+        mock_output = "  status :  idle \r\nno separator here\nserver: https://icloud.com:443\n"
+
+        with patch("subprocess.run") as mock_run:
+            mock_run.return_value = MagicMock(stdout=mock_output, returncode=0)
+            status = ICloudStatusChecker.get_icloud_drive_status()
+
+        assert status == {"status": "idle", "server": "https://icloud.com:443"}
+
     def test_brctl_not_available(self) -> None:
         """Test handling when brctl is not available."""
         with patch("subprocess.run") as mock_run:
@@ -2,11 +2,13 @@
 
 from __future__ import annotations
 
+import os
 from pathlib import Path
 
 import pytest
 
 from icloud_cleanup.config import CleanupConfig
+from icloud_cleanup.modules import scan_all_modules
 from icloud_cleanup.modules.base import DetectedFile
 from icloud_cleanup.modules.coverage_artifacts import CoverageArtifactsModule
 
@@ -132,6 +134,15 @@ class TestNonFileTarget:
 
         assert result is None
 
+    def test_symlink_matching_pattern_returns_none(self, module: CoverageArtifactsModule, tmp_path: Path) -> None:
+        """A symlink named like an artifact is not a target, in is_target or a scan."""
+        real = _create_artifact(tmp_path, "real_artifact")
+        link = tmp_path / ".coverage.host.pid1.abc"
+        link.symlink_to(real)
+
+        assert module.is_target(link) is None
+        assert module.scan_directory(tmp_path) == []
+
 
 class TestScanDirectory:
     """Tests for directory scanning."""
@@ -153,8 +164,31 @@ class TestScanDirectory:
             ".coverage.host.pid3.ccc",
         }
 
+    def test_merged_coverage_found_in_listing(
+        self, module: CoverageArtifactsModule, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """The merged .coverage is found in the directory listing, without a stat() per artifact."""
+        for pid in range(5):
+            _create_artifact(tmp_path, f".coverage.host.pid{pid}.abc")
+
+        def _isfile(path: str) -> bool:
+            raise AssertionError(f"unexpected stat: {path}")
+
+        monkeypatch.setattr(os.path, "isfile", _isfile)
+
+        detected = module.scan_directory(tmp_path)
+
+        assert len(detected) == 5
+
+    def test_merged_coverage_directory_does_not_count(self, module: CoverageArtifactsModule, tmp_path: Path) -> None:
+        """A directory named .coverage is not a merged database."""
+        (tmp_path / ".coverage").mkdir()
+        (tmp_path / ".coverage.host.pid1.abc").touch()
+
+        assert module.scan_directory(tmp_path) == []
+
     def test_recursive_finds_nested_artifacts(self, module: CoverageArtifactsModule, tmp_path: Path) -> None:
-        """Rglob scan finds artifacts in subdirectories."""
+        """Recursive scan finds artifacts in subdirectories."""
         subdir = tmp_path / "project" / "tests"
         subdir.mkdir(parents=True)
         (subdir / ".coverage").touch()
@@ -165,6 +199,28 @@ class TestScanDirectory:
         assert len(detected) == 1
         assert detected[0].path == subdir / ".coverage.host.pid1.abc"
 
+    @pytest.mark.parametrize("skipped", [".git", ".venv", "node_modules", ".tox"])
+    def test_skips_tool_directories(self, module: CoverageArtifactsModule, tmp_path: Path, skipped: str) -> None:
+        """Artifacts inside VCS, virtualenv and tool directories are not reported."""
+        subdir = tmp_path / skipped
+        subdir.mkdir()
+        _create_artifact(subdir, ".coverage.host.pid1.abc")
+
+        detected = module.scan_directory(tmp_path)
+
+        assert detected == []
+
+    def test_does_not_descend_into_symlinked_directories(self, module: CoverageArtifactsModule, tmp_path: Path) -> None:
+        """Artifacts behind a symlinked directory are only reported via the real path."""
+        real = tmp_path / "real"
+        real.mkdir()
+        artifact = _create_artifact(real, ".coverage.host.pid1.abc")
+        (tmp_path / "alias").symlink_to(real)
+
+        detected = module.scan_directory(tmp_path)
+
+        assert [d.path for d in detected] == [artifact]
+
     def test_nonexistent_directory_returns_empty(self, module: CoverageArtifactsModule, tmp_path: Path) -> None:
         """Scanning a directory that does not exist returns an empty list."""
         nonexistent = tmp_path / "does_not_exist"
@@ -206,7 +262,7 @@ class TestScanAll:
         cleanup_config.watch_directories = [dir_a, dir_b]
         module = CoverageArtifactsModule(cleanup_config)
 
-        detected = module.scan_all()
+        detected = scan_all_modules([module], cleanup_config.watch_directories)
 
         assert len(detected) == 3
 
@@ -216,7 +272,7 @@ class TestScanAll:
         cleanup_config.watch_directories = []
         module = CoverageArtifactsModule(cleanup_config)
 
-        detected = module.scan_all()
+        detected = scan_all_modules([module], cleanup_config.watch_directories)
 
         assert detected == []
 
@@ -2,11 +2,17 @@
 
 from __future__ import annotations
 
+import os
+import pkgutil
+from pathlib import Path
+
 import pytest
 
 from icloud_cleanup.config import CleanupConfig
-from icloud_cleanup.modules import discover_modules
-from icloud_cleanup.modules.base import CleanupModule
+from icloud_cleanup.modules import discover_modules, scan_all_modules
+from icloud_cleanup.modules.base import DetectedFile
+
+from .helpers import is_cleanup_module
 
 BUILTIN_MODULE_NAMES = {"icloud_conflicts", "coverage_artifacts", "ephemeral_caches"}
 
@@ -72,4 +78,80 @@ class TestDiscoverModules:
 
         assert len(modules) > 0, "Expected at least one module"
         for module in modules:
-            assert isinstance(module, CleanupModule), f"{module.name} does not satisfy CleanupModule protocol"
+            assert is_cleanup_module(module), f"{module.name} does not satisfy CleanupModule protocol"
+
+    def test_package_walk_is_cached(self, config: CleanupConfig, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Repeat calls reuse the discovered classes but still build fresh instances."""
+        first = discover_modules(config)
+
+        def fail(*_args: object, **_kwargs: object) -> None:
+            raise AssertionError("modules package walked again")
+
+        monkeypatch.setattr(pkgutil, "iter_modules", fail)
+        second = discover_modules(config)
+
+        assert [type(m) for m in second] == [type(m) for m in first]
+        assert all(a is not b for a, b in zip(first, second, strict=True))
+
+
+class TestScanAllModules:
+    """Tests for scan_all_modules, the fused full scan."""
+
+    def test_matches_per_module_scan_directory(self, tmp_path: Path) -> None:
+        """The shared walk finds exactly what each module's own scan_directory finds, grouped by module."""
+        project = tmp_path / "project"
+        (project / "__pycache__").mkdir(parents=True)
+        (project / ".coverage").touch()
+        (project / ".coverage.host.pid1.abc").touch()
+        (project / "notes.txt").touch()
+        (project / "notes 2.txt").touch()
+        config = CleanupConfig(watch_directories=[tmp_path])
+        modules = discover_modules(config)
+
+        fused = scan_all_modules(modules, config.watch_directories)
+
+        expected = [
+            detected
+            for module in modules
+            for directory in config.watch_directories
+            for detected in module.scan_directory(directory)
+        ]
+        assert fused == expected
+        assert {d.module_name for d in fused} == BUILTIN_MODULE_NAMES
+
+    def test_falls_back_to_scan_directory(self, tmp_path: Path) -> None:
+        """A module without scan_entries scans the requested directories itself."""
+
+        class _PlainModule:
+            def scan_directory(self, directory: Path) -> list[DetectedFile]:
+                return [DetectedFile(path=directory, module_name="plain", reason="r", recovery_enabled=False)]
+
+        results = scan_all_modules([_PlainModule()], [tmp_path / "a", tmp_path / "b"])
+
+        assert [d.path for d in results] == [tmp_path / "a", tmp_path / "b"]
+
+    def test_directory_vanishing_mid_walk_is_skipped(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        """A subdirectory removed during the scan is skipped instead of aborting the whole scan."""
+        for name in ("scratch", "project"):
+            (tmp_path / name / "__pycache__").mkdir(parents=True)
+        real_scandir = os.scandir
+
+        def vanishing_scandir(path: str) -> object:
+            if path == str(tmp_path / "scratch"):
+                raise FileNotFoundError(2, "No such file or directory", path)
+            return real_scandir(path)
+
+        monkeypatch.setattr(os, "scandir", vanishing_scandir)
+        config = CleanupConfig(watch_directories=[tmp_path])
+
+        results = scan_all_modules(discover_modules(config), config.watch_directories)
+
+        assert [d.path for d in results] == [tmp_path / "project" / "__pycache__"]
+
+    def test_no_modules(self, tmp_path: Path) -> None:
+        """No modules means no work and no results."""
+        assert scan_all_modules([], [tmp_path]) == []
+
+    def test_no_directories(self, config: CleanupConfig) -> None:
+        """No directories returns before any module is consulted."""
+        assert scan_all_modules(discover_modules(config), []) == []
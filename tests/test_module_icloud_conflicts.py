@@ -2,11 +2,15 @@
 
 from __future__ import annotations
 
+import os
+from dataclasses import FrozenInstanceError
 from pathlib import Path
+from unittest.mock import patch
 
 import pytest
 
 from icloud_cleanup.config import CleanupConfig
+from icloud_cleanup.modules import scan_all_modules
 from icloud_cleanup.modules.base import DetectedFile
 from icloud_cleanup.modules.icloud_conflicts import ConflictFile, ICloudConflictsModule
 
@@ -56,6 +60,19 @@ class TestIsTarget:
         assert isinstance(result, DetectedFile)
         assert result.recovery_enabled is True
 
+    def test_does_not_build_conflict_file(self, module: ICloudConflictsModule, tmp_path: Path) -> None:
+        """is_target works on the parsed name and never allocates a ConflictFile."""
+        (tmp_path / "document.txt").touch()
+        conflict_file = tmp_path / "document 2.txt"
+        conflict_file.touch()
+
+        with patch("icloud_cleanup.modules.icloud_conflicts.ConflictFile") as conflict_cls:
+            result = module.is_target(conflict_file)
+
+        conflict_cls.assert_not_called()
+        assert result is not None
+        assert result.reason == "iCloud conflict #2 of document.txt"
+
     def test_conflict_without_original(self, module: ICloudConflictsModule, tmp_path: Path) -> None:
         """A conflict file without an existing original returns None."""
         conflict_file = tmp_path / "document 2.txt"
@@ -160,7 +177,7 @@ class TestScanDirectory:
         assert names == {"document 2.txt", "document 3.txt"}
 
     def test_finds_conflicts_in_nested_subdirs(self, module: ICloudConflictsModule, tmp_path: Path) -> None:
-        """Scan descends into subdirectories via rglob."""
+        """Scan descends into subdirectories."""
         subdir = tmp_path / "subdir"
         subdir.mkdir()
         deep_dir = subdir / "deep"
@@ -184,6 +201,46 @@ class TestScanDirectory:
         names = {d.path.name for d in detected}
         assert names == {"root 2.txt", "nested 2.txt", "deep 2.txt"}
 
+    def test_only_pattern_matches_are_checked(self, module: ICloudConflictsModule, tmp_path: Path) -> None:
+        """Names that cannot be conflicts are never checked further."""
+        (tmp_path / "document.txt").touch()
+        (tmp_path / "notes.md").touch()
+        (tmp_path / "document 2.txt").touch()
+        checked: list[str] = []
+        original_check = module._check_entry
+
+        def _spy(entry: os.DirEntry[str], parsed: tuple[str, int, str | None], names: set[str]) -> DetectedFile | None:
+            checked.append(entry.name)
+            return original_check(entry, parsed, names)
+
+        with patch.object(module, "_check_entry", side_effect=_spy):
+            detected = module.scan_directory(tmp_path)
+
+        assert checked == ["document 2.txt"]
+        assert [d.path.name for d in detected] == ["document 2.txt"]
+
+    def test_original_found_without_stat(self, module: ICloudConflictsModule, tmp_path: Path) -> None:
+        """The original's existence comes from the directory listing, not os.path.exists."""
+        (tmp_path / "document.txt").touch()
+        (tmp_path / "document 2.txt").touch()
+
+        with patch("os.path.exists", side_effect=AssertionError("unexpected stat")):
+            detected = module.scan_directory(tmp_path)
+
+        assert [d.path.name for d in detected] == ["document 2.txt"]
+
+    def test_does_not_descend_into_symlinked_directories(self, module: ICloudConflictsModule, tmp_path: Path) -> None:
+        """Conflicts behind a symlinked directory are only reported via the real path."""
+        real = tmp_path / "real"
+        real.mkdir()
+        (real / "document.txt").touch()
+        (real / "document 2.txt").touch()
+        (tmp_path / "alias").symlink_to(real)
+
+        detected = module.scan_directory(tmp_path)
+
+        assert [d.path for d in detected] == [real / "document 2.txt"]
+
     def test_nonexistent_directory_returns_empty(self, module: ICloudConflictsModule, tmp_path: Path) -> None:
         """Scanning a nonexistent directory returns an empty list."""
         nonexistent = tmp_path / "does_not_exist"
@@ -202,10 +259,10 @@ class TestScanDirectory:
 
 
 class TestScanAll:
-    """Tests for scan_all across configured watch directories."""
+    """Tests for scanning all configured watch directories."""
 
     def test_scans_all_watch_directories(self, tmp_path: Path) -> None:
-        """scan_all aggregates results from all configured watch directories."""
+        """Results from all configured watch directories are aggregated."""
         dir_a = tmp_path / "dir_a"
         dir_b = tmp_path / "dir_b"
         dir_a.mkdir()
@@ -220,19 +277,19 @@ class TestScanAll:
         cleanup_config.watch_directories = [dir_a, dir_b]
         module = ICloudConflictsModule(cleanup_config)
 
-        detected = module.scan_all()
+        detected = scan_all_modules([module], cleanup_config.watch_directories)
 
         assert len(detected) == 2
         names = {d.path.name for d in detected}
         assert names == {"alpha 2.txt", "beta 2.txt"}
 
     def test_empty_watch_directories(self) -> None:
-        """scan_all with no watch directories returns an empty list."""
+        """No watch directories configured returns an empty list."""
         cleanup_config = CleanupConfig()
         cleanup_config.watch_directories = []
         module = ICloudConflictsModule(cleanup_config)
 
-        detected = module.scan_all()
+        detected = scan_all_modules([module], cleanup_config.watch_directories)
 
         assert detected == []
 
@@ -324,6 +381,30 @@ class TestConflictFileOriginalPath:
         assert conflict.original_path == subdir / "notes.md"
         assert conflict.original_path.parent == conflict.path.parent
 
+    def test_original_path_computed_once(self, tmp_path: Path) -> None:
+        """Repeated access returns the same cached Path object."""
+        conflict = ConflictFile(
+            path=tmp_path / "report 2.pdf",
+            original_name="report",
+            conflict_number=2,
+            extension=".pdf",
+        )
+
+        assert conflict.original_path is conflict.original_path
+
+    def test_fields_cannot_be_reassigned(self, tmp_path: Path) -> None:
+        """ConflictFile is frozen, so a cached original_path can never go stale."""
+        conflict = ConflictFile(
+            path=tmp_path / "report 2.pdf",
+            original_name="report",
+            conflict_number=2,
+            extension=".pdf",
+        )
+        assert conflict.original_path == tmp_path / "report.pdf"
+
+        with pytest.raises(FrozenInstanceError):
+            setattr(conflict, "path", tmp_path / "other" / "report 2.pdf")  # noqa: B010
+
     def test_str_representation(self, tmp_path: Path) -> None:
         """ConflictFile __str__ shows mapping from conflict to original."""
         conflict = ConflictFile(
@@ -351,7 +432,7 @@ class TestEDEADLKHandling:
         (tmp_path / "document 2.txt").write_text("conflict")
 
         edeadlk = OSError(errno.EDEADLK, "Resource deadlock avoided")
-        with patch.object(module, "is_target", side_effect=edeadlk):
+        with patch.object(module, "_check_entry", side_effect=edeadlk):
             detected = module.scan_directory(tmp_path)
 
         assert detected == []
@@ -367,14 +448,16 @@ class TestEDEADLKHandling:
         (tmp_path / "doc2.txt").write_text("c")
         (tmp_path / "doc2 2.txt").write_text("d")
 
-        original_is_target = module.is_target
+        original_check = module._check_entry
 
-        def side_effect(path: Path) -> DetectedFile | None:
-            if path.name == "doc1 2.txt":
+        def side_effect(
+            entry: os.DirEntry[str], parsed: tuple[str, int, str | None], names: set[str]
+        ) -> DetectedFile | None:
+            if entry.name == "doc1 2.txt":
                 raise OSError(errno.EDEADLK, "Resource deadlock avoided")
-            return original_is_target(path)
+            return original_check(entry, parsed, names)
 
-        with patch.object(module, "is_target", side_effect=side_effect):
+        with patch.object(module, "_check_entry", side_effect=side_effect):
             detected = module.scan_directory(tmp_path)
 
         assert len(detected) == 1
@@ -389,5 +472,5 @@ class TestEDEADLKHandling:
         (tmp_path / "document 2.txt").write_text("conflict")
 
         eio = OSError(errno.EIO, "Input/output error")
-        with patch.object(module, "is_target", side_effect=eio), pytest.raises(OSError, match="Input/output error"):
+        with patch.object(module, "_check_entry", side_effect=eio), pytest.raises(OSError, match="Input/output error"):
             module.scan_directory(tmp_path)
@@ -2,81 +2,95 @@
 
 from __future__ import annotations
 
+import dataclasses
+import os
 from dataclasses import FrozenInstanceError
 from pathlib import Path
+from typing import TYPE_CHECKING
 
 import pytest
 
-from icloud_cleanup.modules.base import CleanupModule, DetectedFile
+from icloud_cleanup.modules.base import (
+    CleanupModule,
+    DetectedFile,
+    is_level_scanner,
+    walk_levels,
+)
+
+from .helpers import is_cleanup_module
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterable
+
+
+# Pure value tests only need a Path, never a real directory
+BASE_PATH = Path("/nonexistent/test_base")
+FILE_PATH = BASE_PATH / "file.txt"
+DOC_PATH = BASE_PATH / "document 2.txt"
+
+
+@pytest.fixture(scope="module")
+def canonical_detected() -> DetectedFile:
+    """Provide a shared DetectedFile; it is frozen, so tests cannot disturb each other."""
+    return DetectedFile(path=FILE_PATH, module_name="my_module", reason="some reason", recovery_enabled=True)
 
 
 class TestDetectedFile:
     """Tests for the DetectedFile frozen dataclass."""
 
-    def test_creation_with_all_fields(self, tmp_path: Path) -> None:
+    def test_creation_with_all_fields(self) -> None:
         """Test creating a DetectedFile with all required fields."""
-        file_path = tmp_path / "document 2.txt"
         detected = DetectedFile(
-            path=file_path,
+            path=DOC_PATH,
             module_name="icloud_conflicts",
             reason="Conflict file with number 2",
             recovery_enabled=True,
         )
 
-        assert detected.path == file_path
+        assert detected.path == DOC_PATH
         assert detected.module_name == "icloud_conflicts"
         assert detected.reason == "Conflict file with number 2"
         assert detected.recovery_enabled is True
 
-    def test_frozen_prevents_attribute_mutation(self, tmp_path: Path) -> None:
+    def test_frozen_prevents_attribute_mutation(self) -> None:
         """Test that frozen dataclass rejects attribute assignment."""
         detected = DetectedFile(
-            path=tmp_path / "file.txt",
+            path=FILE_PATH,
             module_name="test_module",
             reason="test reason",
             recovery_enabled=False,
         )
 
-        with pytest.raises(FrozenInstanceError):
-            setattr(detected, "path", tmp_path / "other.txt")  # noqa: B010
-
-        with pytest.raises(FrozenInstanceError):
-            setattr(detected, "module_name", "changed")  # noqa: B010
+        for attr, value in (
+            ("path", BASE_PATH / "other.txt"),
+            ("module_name", "changed"),
+            ("reason", "changed"),
+            ("recovery_enabled", True),
+        ):
+            with pytest.raises(FrozenInstanceError):
+                setattr(detected, attr, value)
 
-        with pytest.raises(FrozenInstanceError):
-            setattr(detected, "reason", "changed")  # noqa: B010
-
-        with pytest.raises(FrozenInstanceError):
-            setattr(detected, "recovery_enabled", True)  # noqa: B010
-
-    def test_equality_same_values(self, tmp_path: Path) -> None:
+    def test_equality_same_values(self, canonical_detected: DetectedFile) -> None:
         """Test that two DetectedFile instances with identical values are equal."""
-        file_path = tmp_path / "document 2.txt"
-        first = DetectedFile(
-            path=file_path,
-            module_name="mod",
-            reason="reason",
-            recovery_enabled=True,
-        )
         second = DetectedFile(
-            path=file_path,
-            module_name="mod",
-            reason="reason",
-            recovery_enabled=True,
+            path=canonical_detected.path,
+            module_name=canonical_detected.module_name,
+            reason=canonical_detected.reason,
+            recovery_enabled=canonical_detected.recovery_enabled,
         )
 
-        assert first == second
+        assert canonical_detected == second
 
-    def test_inequality_different_values(self, tmp_path: Path) -> None:
+    def test_inequality_different_values(self) -> None:
         """Test that DetectedFile instances with different values are not equal."""
         first = DetectedFile(
-            path=tmp_path / "a.txt",
+            path=BASE_PATH / "a.txt",
             module_name="mod",
             reason="reason",
             recovery_enabled=True,
         )
         second = DetectedFile(
-            path=tmp_path / "b.txt",
+            path=BASE_PATH / "b.txt",
             module_name="mod",
             reason="reason",
             recovery_enabled=True,
@@ -84,64 +98,56 @@ class TestDetectedFile:
 
         assert first != second
 
-    @pytest.mark.parametrize(
-        "a,b",
-        [
-            (
-                DetectedFile(path=Path("/f"), module_name="module_a", reason="r", recovery_enabled=True),
-                DetectedFile(path=Path("/f"), module_name="module_b", reason="r", recovery_enabled=True),
-            ),
-            (
-                DetectedFile(path=Path("/f"), module_name="m", reason="reason one", recovery_enabled=True),
-                DetectedFile(path=Path("/f"), module_name="m", reason="reason two", recovery_enabled=True),
-            ),
-            (
-                DetectedFile(path=Path("/f"), module_name="m", reason="r", recovery_enabled=True),
-                DetectedFile(path=Path("/f"), module_name="m", reason="r", recovery_enabled=False),
-            ),
-        ],
-    )
-    def test_inequality_per_field(self, a: DetectedFile, b: DetectedFile) -> None:
+    def test_inequality_per_field(self, canonical_detected: DetectedFile) -> None:
         """Test that differing any single field produces inequality."""
-        assert a != b
-
-    def test_hash_consistency(self, tmp_path: Path) -> None:
+        for field, value_a, value_b in (
+            ("module_name", "module_a", "module_b"),
+            ("reason", "reason one", "reason two"),
+            ("recovery_enabled", True, False),
+        ):
+            a = dataclasses.replace(canonical_detected, **{field: value_a})
+            b = dataclasses.replace(canonical_detected, **{field: value_b})
+            assert a != b, field
+
+    def test_hash_consistency(self, canonical_detected: DetectedFile) -> None:
         """Test that equal DetectedFile instances produce the same hash."""
-        file_path = tmp_path / "doc.txt"
-        first = DetectedFile(path=file_path, module_name="m", reason="r", recovery_enabled=False)
-        second = DetectedFile(path=file_path, module_name="m", reason="r", recovery_enabled=False)
+        second = dataclasses.replace(canonical_detected)
 
-        assert hash(first) == hash(second)
+        assert second is not canonical_detected
+        assert hash(canonical_detected) == hash(second)
 
-    def test_usable_in_set(self, tmp_path: Path) -> None:
+    def test_usable_in_set(self, canonical_detected: DetectedFile) -> None:
         """Test that frozen DetectedFile instances can be stored in a set."""
-        file_path = tmp_path / "doc.txt"
-        detected = DetectedFile(path=file_path, module_name="m", reason="r", recovery_enabled=True)
-        duplicate = DetectedFile(path=file_path, module_name="m", reason="r", recovery_enabled=True)
+        duplicate = dataclasses.replace(canonical_detected)
 
-        result = {detected, duplicate}
+        result = {canonical_detected, duplicate}
 
         assert len(result) == 1
 
-    def test_repr_contains_field_values(self, tmp_path: Path) -> None:
+    def test_repr_contains_field_values(self, canonical_detected: DetectedFile) -> None:
         """Test that repr includes field values for debugging."""
-        file_path = tmp_path / "file.txt"
-        detected = DetectedFile(
-            path=file_path,
-            module_name="my_module",
-            reason="some reason",
-            recovery_enabled=True,
-        )
-        representation = repr(detected)
+        representation = repr(canonical_detected)
 
         assert "my_module" in representation
         assert "some reason" in representation
         assert "file.txt" in representation
 
-    def test_recovery_enabled_false(self, tmp_path: Path) -> None:
+    def test_uses_slots(self) -> None:
+        """Test instances carry no per-instance __dict__."""
+        detected = DetectedFile(
+            path=FILE_PATH,
+            module_name="test",
+            reason="test",
+            recovery_enabled=False,
+        )
+
+        assert "__slots__" in type(detected).__dict__
+        assert not hasattr(detected, "__dict__")
+
+    def test_recovery_enabled_false(self) -> None:
         """Test creation with recovery disabled."""
         detected = DetectedFile(
-            path=tmp_path / "file.txt",
+            path=FILE_PATH,
             module_name="mod",
             reason="reason",
             recovery_enabled=False,
@@ -155,209 +161,245 @@ class TestCleanupModuleProtocol:
 
     def test_conforming_class_passes_isinstance(self) -> None:
         """Test that a fully conforming class satisfies the protocol."""
+        assert is_cleanup_module(_ConformingModule())
 
-        class ConformingModule:
-            MODULE_ENABLED: bool = True
-            name: str = "conforming"
-            supports_watch: bool = True
+    def test_non_conforming_fails_isinstance(self) -> None:
+        """Test that objects missing any protocol member do not satisfy the protocol."""
+        for obj in ("a string", 42, [], _EmptyClass(), _MissingAttribute()):
+            assert not is_cleanup_module(obj), obj
 
-            @staticmethod
-            def is_target(_path: Path) -> DetectedFile | None:
-                return None
+    def test_missing_can_match_fails_isinstance(self) -> None:
+        """Test that a class missing can_match does not satisfy the protocol."""
+        assert not is_cleanup_module(_MissingCanMatch())
 
-            @staticmethod
-            def scan_directory(_directory: Path) -> list[DetectedFile]:
-                return []
 
-            @staticmethod
-            def scan_all() -> list[DetectedFile]:
-                return []
+@pytest.fixture(scope="module")
+def mock_module() -> _MockCleanupModule:
+    """Provide one minimal mock module; it holds no per-test state."""
+    return _MockCleanupModule()
 
-            @staticmethod
-            def can_match(_name: str) -> bool:
-                return True
 
-        instance = ConformingModule()
-        assert isinstance(instance, CleanupModule)
+class TestMinimalMockModule:
+    """Tests using a minimal mock implementation to verify protocol conformance."""
 
-    def test_missing_method_fails_isinstance(self) -> None:
-        """Test that a class missing a required method does not satisfy the protocol."""
+    def test_mock_satisfies_protocol(self, mock_module: _MockCleanupModule) -> None:
+        """Test that the mock module passes isinstance check."""
+        assert is_cleanup_module(mock_module)
 
-        class MissingScanAll:
-            MODULE_ENABLED: bool = True
-            name: str = "incomplete"
-            supports_watch: bool = False
+    def test_fast_check_agrees_with_protocol(self, mock_module: _MockCleanupModule) -> None:
+        """Test is_cleanup_module gives the same answer as the Protocol isinstance()."""
+        for obj in (mock_module, _LevelScanner(".tmp"), "a string", object()):
+            assert is_cleanup_module(obj) == isinstance(obj, CleanupModule)
 
-            @staticmethod
-            def is_target(_path: Path) -> DetectedFile | None:
-                return None
+    def test_is_target_returns_detected_file(self, mock_module: _MockCleanupModule, tmp_path: Path) -> None:
+        """Test that is_target returns a DetectedFile for matching paths."""
+        target_file = tmp_path / "target.tmp"
+        target_file.touch()
 
-            @staticmethod
-            def scan_directory(_directory: Path) -> list[DetectedFile]:
-                return []
+        result = mock_module.is_target(target_file)
 
-            # scan_all intentionally omitted
+        assert result is not None
+        assert isinstance(result, DetectedFile)
+        assert result.path == target_file
+        assert result.module_name == "mock_module"
 
-        instance = MissingScanAll()
-        assert not isinstance(instance, CleanupModule)
+    def test_is_target_returns_none_for_non_match(self, mock_module: _MockCleanupModule, tmp_path: Path) -> None:
+        """Test that is_target returns None for non-matching paths."""
+        non_target = tmp_path / "document.txt"
 
-    def test_missing_attribute_fails_isinstance(self) -> None:
-        """Test that a class missing a required attribute does not satisfy the protocol."""
+        result = mock_module.is_target(non_target)
 
-        class MissingAttribute:
-            # MODULE_ENABLED intentionally omitted
-            name: str = "missing_attr"
-            supports_watch: bool = True
+        assert result is None
 
-            @staticmethod
-            def is_target(_path: Path) -> DetectedFile | None:
-                return None
+    def test_scan_directory(self) -> None:
+        """Test scanning a directory with mixed files."""
+        directory = Path("/virtual")
+        module = _MockCleanupModule(list_files=lambda d: [d / "a.tmp", d / "b.tmp", d / "keep.txt"])
 
-            @staticmethod
-            def scan_directory(_directory: Path) -> list[DetectedFile]:
-                return []
+        results = module.scan_directory(directory)
 
-            @staticmethod
-            def scan_all() -> list[DetectedFile]:
-                return []
+        assert len(results) == 2
+        result_names = {r.path.name for r in results}
+        assert result_names == {"a.tmp", "b.tmp"}
 
-        instance = MissingAttribute()
-        assert not isinstance(instance, CleanupModule)
+    def test_module_attributes(self, mock_module: _MockCleanupModule) -> None:
+        """Test that module attributes are accessible and correct."""
+        assert mock_module.MODULE_ENABLED is True
+        assert mock_module.name == "mock_module"
+        assert mock_module.supports_watch is True
 
-    def test_empty_class_fails_isinstance(self) -> None:
-        """Test that an empty class does not satisfy the protocol."""
 
-        class EmptyClass:
-            pass
+class TestCanMatch:
+    """Tests for can_match string pre-filter on the mock module."""
 
-        instance = EmptyClass()
-        assert not isinstance(instance, CleanupModule)
+    def test_mock_can_match_positive(self, mock_module: _MockCleanupModule) -> None:
+        """Test that can_match returns True for matching names."""
+        assert mock_module.can_match("file.tmp") is True
 
-    def test_unrelated_object_fails_isinstance(self) -> None:
-        """Test that unrelated built-in types do not satisfy the protocol."""
-        assert not isinstance("a string", CleanupModule)
-        assert not isinstance(42, CleanupModule)
-        assert not isinstance([], CleanupModule)
+    def test_mock_can_match_negative(self, mock_module: _MockCleanupModule) -> None:
+        """Test that can_match returns False for non-matching names."""
+        assert mock_module.can_match("file.txt") is False
 
-    def test_missing_can_match_fails_isinstance(self) -> None:
-        """Test that a class missing can_match does not satisfy the protocol."""
 
-        class MissingCanMatch:
-            MODULE_ENABLED: bool = True
-            name: str = "no_can_match"
-            supports_watch: bool = True
+class TestWalkLevels:
+    """Tests for the shared walk_levels tree walker."""
 
-            @staticmethod
-            def is_target(_path: Path) -> DetectedFile | None:
-                return None
+    def test_lists_each_directory_once_for_all_scanners(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test two scanners sharing a walk cost one scandir per directory."""
+        (tmp_path / "sub").mkdir()
+        (tmp_path / "sub" / "a.tmp").touch()
+        listed: list[str] = []
+        real_scandir = os.scandir
 
-            @staticmethod
-            def scan_directory(_directory: Path) -> list[DetectedFile]:
-                return []
+        def counting_scandir(path: str) -> object:
+            listed.append(path)
+            return real_scandir(path)
 
-            @staticmethod
-            def scan_all() -> list[DetectedFile]:
-                return []
+        monkeypatch.setattr(os, "scandir", counting_scandir)
+        scanners = [_LevelScanner(".tmp"), _LevelScanner(".tmp")]
 
-        instance = MissingCanMatch()
-        assert not isinstance(instance, CleanupModule)
+        results = list(walk_levels(tmp_path, scanners))
 
+        assert sorted(listed) == sorted([str(tmp_path), str(tmp_path / "sub")])
+        assert [(index, d.path.name) for index, d in results] == [(0, "a.tmp"), (1, "a.tmp")]
 
-class TestMinimalMockModule:
-    """Tests using a minimal mock implementation to verify protocol conformance."""
+    def test_subdirectory_visited_only_by_scanners_that_descend(self, tmp_path: Path) -> None:
+        """Test a scanner that prunes a directory sees nothing below it."""
+        (tmp_path / "skip").mkdir()
+        (tmp_path / "skip" / "a.tmp").touch()
+        scanners = [_LevelScanner(".tmp"), _LevelScanner(".tmp", prune="skip")]
 
-    @staticmethod
-    def _make_module() -> _MockCleanupModule:
-        """Create a minimal mock module that satisfies CleanupModule."""
-        return _MockCleanupModule()
+        results = list(walk_levels(tmp_path, scanners))
 
-    def test_mock_satisfies_protocol(self) -> None:
-        """Test that the mock module passes isinstance check."""
-        module = self._make_module()
-        assert isinstance(module, CleanupModule)
+        assert [index for index, _ in results] == [0]
 
-    def test_is_target_returns_detected_file(self, tmp_path: Path) -> None:
-        """Test that is_target returns a DetectedFile for matching paths."""
-        module = self._make_module()
-        target_file = tmp_path / "target.tmp"
-        target_file.touch()
+    def test_missing_directory_yields_nothing(self, tmp_path: Path) -> None:
+        """Test a nonexistent top directory is skipped quietly."""
+        assert list(walk_levels(tmp_path / "missing", [_LevelScanner(".tmp")])) == []
 
-        result = module.is_target(target_file)
+    def test_file_as_directory_yields_nothing(self, tmp_path: Path) -> None:
+        """Test a regular file passed as the top directory is skipped quietly."""
+        (tmp_path / "a.tmp").touch()
 
-        assert result is not None
-        assert isinstance(result, DetectedFile)
-        assert result.path == target_file
-        assert result.module_name == "mock_module"
+        assert list(walk_levels(tmp_path / "a.tmp", [_LevelScanner(".tmp")])) == []
 
-    def test_is_target_returns_none_for_non_match(self, tmp_path: Path) -> None:
-        """Test that is_target returns None for non-matching paths."""
-        module = self._make_module()
-        non_target = tmp_path / "document.txt"
+    def test_directory_vanishing_mid_walk_is_skipped(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test a subdirectory deleted between listing its parent and reading it is skipped."""
+        for name in ("gone", "kept"):
+            (tmp_path / name).mkdir()
+            (tmp_path / name / "a.tmp").touch()
+        real_scandir = os.scandir
 
-        result = module.is_target(non_target)
+        def vanishing_scandir(path: str) -> object:
+            if path == str(tmp_path / "gone"):
+                raise FileNotFoundError(2, "No such file or directory", path)
+            return real_scandir(path)
 
-        assert result is None
+        monkeypatch.setattr(os, "scandir", vanishing_scandir)
 
-    def test_scan_directory(self, tmp_path: Path) -> None:
-        """Test scanning a directory with mixed files."""
-        module = self._make_module()
+        results = list(walk_levels(tmp_path, [_LevelScanner(".tmp")]))
 
-        (tmp_path / "a.tmp").touch()
-        (tmp_path / "b.tmp").touch()
-        (tmp_path / "keep.txt").touch()
+        assert [d.path for _index, d in results] == [tmp_path / "kept" / "a.tmp"]
 
-        results = module.scan_directory(tmp_path)
+    def test_level_scanner_check(self) -> None:
+        """Test scan_entries alone makes an object a level scanner."""
+        assert is_level_scanner(_LevelScanner(".tmp"))
+        assert not is_level_scanner(_MockCleanupModule())
 
-        assert len(results) == 2
-        result_names = {r.path.name for r in results}
-        assert result_names == {"a.tmp", "b.tmp"}
 
-    def test_scan_all_uses_configured_directories(self, tmp_path: Path) -> None:
-        """Test that scan_all scans the configured watch directories."""
-        module = _MockCleanupModule(watch_directories=[tmp_path])
-        (tmp_path / "file.tmp").touch()
-        (tmp_path / "other.txt").touch()
+class _LevelScanner:
+    """Minimal LevelScanner: detects files by suffix, descends into every other directory."""
 
-        results = module.scan_all()
+    def __init__(self, suffix: str, prune: str | None = None) -> None:
+        self._suffix = suffix
+        self._prune = prune
 
-        assert len(results) == 1
-        assert results[0].path.name == "file.tmp"
+    def scan_entries(self, directory: str, entries: list[os.DirEntry[str]]) -> tuple[list[DetectedFile], list[str]]:
+        detected = [
+            DetectedFile(path=Path(e.path), module_name="level", reason="suffix", recovery_enabled=False)
+            for e in entries
+            if e.name.endswith(self._suffix)
+        ]
+        subdirs = [e.path for e in entries if e.is_dir() and e.name != self._prune]
+        return detected, subdirs
 
-    def test_module_attributes(self) -> None:
-        """Test that module attributes are accessible and correct."""
-        module = self._make_module()
 
-        assert module.MODULE_ENABLED is True
-        assert module.name == "mock_module"
-        assert module.supports_watch is True
+class _ConformingModule:
+    """Implements every CleanupModule member."""
 
+    MODULE_ENABLED: bool = True
+    name: str = "conforming"
+    supports_watch: bool = True
 
-class TestCanMatch:
-    """Tests for can_match string pre-filter on the mock module."""
+    @staticmethod
+    def is_target(_path: Path) -> DetectedFile | None:
+        return None
 
-    def test_mock_can_match_positive(self) -> None:
-        """Test that can_match returns True for matching names."""
-        module = _MockCleanupModule()
-        assert module.can_match("file.tmp") is True
+    @staticmethod
+    def scan_directory(_directory: Path) -> list[DetectedFile]:
+        return []
+
+    @staticmethod
+    def can_match(_name: str) -> bool:
+        return True
+
+
+class _MissingAttribute:
+    """Lacks the MODULE_ENABLED attribute."""
+
+    name: str = "missing_attr"
+    supports_watch: bool = True
+
+    @staticmethod
+    def is_target(_path: Path) -> DetectedFile | None:
+        return None
+
+    @staticmethod
+    def scan_directory(_directory: Path) -> list[DetectedFile]:
+        return []
 
-    def test_mock_can_match_negative(self) -> None:
-        """Test that can_match returns False for non-matching names."""
-        module = _MockCleanupModule()
-        assert module.can_match("file.txt") is False
+
+class _MissingCanMatch:
+    """Has every member except can_match."""
+
+    MODULE_ENABLED: bool = True
+    name: str = "no_can_match"
+    supports_watch: bool = True
+
+    @staticmethod
+    def is_target(_path: Path) -> DetectedFile | None:
+        return None
+
+    @staticmethod
+    def scan_directory(_directory: Path) -> list[DetectedFile]:
+        return []
+
+
+class _EmptyClass:
+    pass
+
+
+def _list_files(directory: Path) -> list[Path]:
+    """List the ``.tmp`` regular files directly inside ``directory``.
+
+    The glob filters on names first, so only candidates pay for is_file().
+    """
+    return [child for child in directory.glob("*.tmp") if child.is_file()]
 
 
 class _MockCleanupModule:
     """Minimal CleanupModule implementation for testing protocol conformance.
 
-    Detects files with `.tmp` suffix as cleanup targets.
+    Detects files with `.tmp` suffix as cleanup targets. ``list_files``
+    replaces the directory listing so scan tests need no real files.
     """
 
     MODULE_ENABLED: bool = True
     name: str = "mock_module"
     supports_watch: bool = True
 
-    def __init__(self, watch_directories: list[Path] | None = None) -> None:
-        self._watch_directories = watch_directories or []
+    def __init__(self, list_files: Callable[[Path], Iterable[Path]] | None = None) -> None:
+        self._list_files = list_files or _list_files
 
     def is_target(self, path: Path) -> DetectedFile | None:
         if path.suffix == ".tmp":
@@ -371,18 +413,11 @@ class _MockCleanupModule:
 
     def scan_directory(self, directory: Path) -> list[DetectedFile]:
         results: list[DetectedFile] = []
-        for child in directory.iterdir():
-            if child.is_file():
-                detected = self.is_target(child)
-                if detected is not None:
-                    results.append(detected)
+        for child in self._list_files(directory):
+            detected = self.is_target(child)
+            if detected is not None:
+                results.append(detected)
         return results
 
-    def scan_all(self) -> list[DetectedFile]:
-        all_detected: list[DetectedFile] = []
-        for directory in self._watch_directories:
-            all_detected.extend(self.scan_directory(directory))
-        return all_detected
-
     def can_match(self, name: str) -> bool:
         return name.endswith(".tmp")
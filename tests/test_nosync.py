@@ -2,7 +2,9 @@
 
 from __future__ import annotations
 
+import fnmatch
 import logging
+import os
 from pathlib import Path
 
 import pytest
@@ -14,6 +16,7 @@ from icloud_cleanup.nosync import (
     VALUABLE_PATTERNS,
     NosyncManager,
     NosyncResult,
+    split_patterns,
 )
 
 
@@ -140,6 +143,15 @@ class TestIsNosyncCandidate:
         """Test that .mypy_cache is a candidate."""
         self._assert_is_candidate(tmp_path, ".mypy_cache")
 
+    def test_non_matching_name_needs_no_stat(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test that names outside the patterns are rejected without touching the filesystem."""
+
+        def fail(_self: Path) -> bool:
+            raise AssertionError("unexpected stat")
+
+        monkeypatch.setattr(Path, "is_dir", fail)
+        assert not NosyncManager.is_nosync_candidate(Path("/nonexistent/src"))
+
 
 class TestConvertToNosync:
     """Tests for convert_to_nosync method."""
@@ -193,6 +205,12 @@ class TestConvertToNosync:
         link.symlink_to(target)
         self._assert_convert_fails(manager, link, "symlink")
 
+    def test_convert_broken_symlink_fails(self, manager: NosyncManager, tmp_path: Path) -> None:
+        """Test that a dangling symlink is reported as a symlink, not converted."""
+        link = tmp_path / "node_modules"
+        link.symlink_to(tmp_path / "gone")
+        self._assert_convert_fails(manager, link, "symlink")
+
     def test_convert_when_nosync_exists(self, manager: NosyncManager, tmp_path: Path) -> None:
         """Test converting when .nosync already exists fails."""
         venv = tmp_path / ".venv"
@@ -308,6 +326,43 @@ class TestScanForCandidates:
 
         assert candidates == []
 
+    def test_scan_does_not_follow_directory_symlinks(self, manager: NosyncManager, tmp_path: Path) -> None:
+        """Test that symlinked directories are not descended into."""
+        outside = tmp_path / "outside"
+        (outside / "__pycache__").mkdir(parents=True)
+        root = tmp_path / "root"
+        root.mkdir()
+        (root / "linked").symlink_to(outside, target_is_directory=True)
+
+        candidates = manager.scan_for_candidates(root)
+
+        assert candidates == []
+
+    def test_scan_skips_directory_vanishing_mid_walk(
+        self, manager: NosyncManager, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test that a subdirectory deleted during the walk is skipped instead of aborting the scan."""
+        (tmp_path / "scratch" / "__pycache__").mkdir(parents=True)
+        (tmp_path / "project" / ".venv").mkdir(parents=True)
+        real_scandir = os.scandir
+
+        def vanishing_scandir(path: str) -> object:
+            if path == str(tmp_path / "scratch"):
+                raise FileNotFoundError(2, "No such file or directory", path)
+            return real_scandir(path)
+
+        monkeypatch.setattr(os, "scandir", vanishing_scandir)
+
+        candidates = manager.scan_for_candidates(tmp_path)
+
+        assert candidates == [tmp_path / "project" / ".venv"]
+
+    def test_scan_file_as_directory_returns_empty(self, manager: NosyncManager, tmp_path: Path) -> None:
+        """Test that scanning a regular file returns empty."""
+        (tmp_path / "notes.txt").touch()
+
+        assert manager.scan_for_candidates(tmp_path / "notes.txt") == []
+
 
 class TestScanAll:
     """Tests for the scan_all method."""
@@ -361,6 +416,40 @@ class TestScanAll:
         assert len(candidates) == 1
         assert candidates[0].name == ".venv"
 
+    def test_scan_all_skips_missing_roots_before_dispatch(
+        self, config: CleanupConfig, logger: logging.Logger, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test missing watch directories are never handed to scan_for_candidates."""
+        existing_dir = tmp_path / "existing"
+        existing_dir.mkdir()
+        config.watch_directories = [tmp_path / "missing", existing_dir]
+        manager = NosyncManager(config, logger)
+
+        scanned: list[Path] = []
+        original = manager.scan_for_candidates
+
+        def recording_scan(directory: Path) -> list[Path]:
+            scanned.append(directory)
+            return original(directory)
+
+        monkeypatch.setattr(manager, "scan_for_candidates", recording_scan)
+        manager.scan_all()
+
+        assert scanned == [existing_dir]
+
+    def test_scan_all_keeps_watch_directory_order(
+        self, config: CleanupConfig, logger: logging.Logger, tmp_path: Path
+    ) -> None:
+        """Test results are grouped in watch-directory order although directories are scanned concurrently."""
+        dirs = [tmp_path / name for name in ("b", "a", "c")]
+        for directory in dirs:
+            (directory / ".venv").mkdir(parents=True)
+
+        config.watch_directories = dirs
+        manager = NosyncManager(config, logger)
+
+        assert manager.scan_all() == [directory / ".venv" for directory in dirs]
+
 
 class TestWildcardPatterns:
     """Tests for wildcard pattern matching."""
@@ -388,6 +477,20 @@ class TestWildcardPatterns:
             path.mkdir()
             assert not NosyncManager.is_nosync_candidate(path)
 
+    def test_split_patterns_separates_exact_and_suffixes(self) -> None:
+        """Test that split_patterns strips the leading * into a suffix tuple."""
+        exact, suffixes = split_patterns(frozenset({".venv", "*.egg-info", "build"}))
+
+        assert exact == frozenset({".venv", "build"})
+        assert suffixes == (".egg-info",)
+
+    @pytest.mark.parametrize("name", ["build", "pkg.egg-info", "dist", ".venv", "src", "build.nosync"])
+    def test_matches_patterns_agrees_with_glob(self, name: str) -> None:
+        """Test that the split-set matcher matches exactly what the glob patterns match."""
+        expected = any(fnmatch.fnmatchcase(name, pattern) for pattern in DEFAULT_EXCLUDE_PATTERNS)
+
+        assert NosyncManager.matches_patterns(name, DEFAULT_EXCLUDE_PATTERNS) is expected
+
 
 class TestPatternCategories:
     """Tests for valuable vs ephemeral pattern split."""
@@ -514,6 +617,29 @@ class TestVerifyAndRepair:
         results = manager.verify_and_repair(tmp_path)
         assert len(results) == 2
 
+    def test_lists_directory_once(
+        self, manager: NosyncManager, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Several .nosync dirs with conflict copies are all repaired from a single listing."""
+        for name in [".venv", "node_modules"]:
+            (tmp_path / f"{name}.nosync").mkdir()
+            (tmp_path / f"{name} 2").symlink_to(f"{name}.nosync")
+        listed: list[Path] = []
+        real_scandir = os.scandir
+
+        def counting_scandir(path: Path) -> object:
+            listed.append(path)
+            return real_scandir(path)
+
+        monkeypatch.setattr(os, "scandir", counting_scandir)
+
+        results = manager.verify_and_repair(tmp_path)
+
+        assert listed == [tmp_path]
+        assert [r.action for r in results] == ["repaired", "repaired"]
+        assert not (tmp_path / ".venv 2").is_symlink()
+        assert (tmp_path / "node_modules").is_symlink()
+
     def test_nonexistent_directory(self, manager: NosyncManager, tmp_path: Path) -> None:
         results = manager.verify_and_repair(tmp_path / "missing")
         assert results == []
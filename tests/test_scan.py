@@ -0,0 +1,62 @@
+"""Tests for the shared directory scan pool."""
+
+from __future__ import annotations
+
+import threading
+from pathlib import Path
+
+from icloud_cleanup._scan import scan_directories
+
+# The scan callables never touch the filesystem, so any Path will do
+BASE_PATH = Path("/nonexistent/test_scan")
+
+
+class TestScanDirectories:
+    """Tests for the scan_directories fan-out helper."""
+
+    def test_preserves_directory_order(self) -> None:
+        """Test results are grouped in the order directories were given."""
+        dirs = [BASE_PATH / name for name in ("a", "b", "c")]
+        results = list(scan_directories(lambda d: [d.name, d.name.upper()], dirs))
+        assert results == ["a", "A", "b", "B", "c", "C"]
+
+    def test_scans_multiple_directories_concurrently(self) -> None:
+        """Test each directory is scanned in its own worker thread."""
+        barrier = threading.Barrier(2, timeout=5)
+
+        def scan(directory: Path) -> list[Path]:
+            barrier.wait()
+            return [directory]
+
+        dirs = [BASE_PATH / "a", BASE_PATH / "b"]
+        assert list(scan_directories(scan, dirs)) == dirs
+
+    def test_reuses_shared_worker_pool(self) -> None:
+        """Test repeated fan-outs run on the same long-lived scan threads."""
+        seen: list[threading.Thread] = []
+
+        def scan(directory: Path) -> list[Path]:
+            seen.append(threading.current_thread())
+            return [directory]
+
+        list(scan_directories(scan, [BASE_PATH / "a", BASE_PATH / "b"]))
+
+        assert all(thread.name.startswith("scan") for thread in seen)
+        # Workers outlive the call, ready for the next scan cycle
+        assert all(thread.is_alive() for thread in seen)
+
+    def test_single_directory_is_lazy(self) -> None:
+        """Test a single directory is scanned lazily in the calling thread."""
+        calls: list[Path] = []
+
+        def scan(directory: Path) -> list[Path]:
+            calls.append(directory)
+            return [directory]
+
+        results = scan_directories(scan, [BASE_PATH])
+        assert calls == []
+        assert list(results) == [BASE_PATH]
+
+    def test_no_directories(self) -> None:
+        """Test an empty directory list yields nothing."""
+        assert list(scan_directories(lambda d: [d], [])) == []
@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import asyncio
 import logging
+import os
 from pathlib import Path
 from unittest.mock import MagicMock, patch
 
@@ -37,81 +38,71 @@ def watcher(config: CleanupConfig, logger: logging.Logger) -> FileWatcher:
 class TestConflictEventHandler:
     """Tests for the zero-I/O event handler."""
 
-    def test_on_created_enqueues_path(self, watcher: FileWatcher, logger: logging.Logger, tmp_path: Path) -> None:
-        """Test that a created file path is enqueued."""
-        handler = ConflictEventHandler(watcher, logger)
-
-        file_path = tmp_path / "document 2.txt"
-        event = FileCreatedEvent(str(file_path))
-        handler.on_created(event)
-
-        drained = watcher.drain_paths()
-        assert file_path in drained
-
-    def test_on_created_regular_file(self, watcher: FileWatcher, logger: logging.Logger, tmp_path: Path) -> None:
-        """Test that regular files are also enqueued (filtering happens later)."""
-        handler = ConflictEventHandler(watcher, logger)
-
-        regular_file = tmp_path / "document.txt"
-        event = FileCreatedEvent(str(regular_file))
-        handler.on_created(event)
-
-        drained = watcher.drain_paths()
-        assert regular_file in drained
-
-    def test_on_created_ignores_directory_events(
-        self, watcher: FileWatcher, logger: logging.Logger, tmp_path: Path
+    @pytest.mark.parametrize(
+        "name,is_directory,as_bytes,enqueued",
+        [
+            ("document 2.txt", False, False, True),  # conflict-shaped file
+            ("document.txt", False, False, True),  # regular files too; filtering happens later
+            ("document 2.txt", False, True, True),  # some FSEvents return bytes paths
+            ("subdir 2", True, False, False),  # directory events are ignored
+        ],
+    )
+    def test_on_created(
+        self,
+        watcher: FileWatcher,
+        logger: logging.Logger,
+        tmp_path: Path,
+        name: str,
+        is_directory: bool,
+        as_bytes: bool,
+        enqueued: bool,
     ) -> None:
-        """Test that a directory creation event is ignored."""
+        """Test which created paths the handler enqueues."""
         handler = ConflictEventHandler(watcher, logger)
 
-        new_dir = tmp_path / "subdir 2"
-        event = FileCreatedEvent(str(new_dir))
-        event.is_directory = True
+        path = tmp_path / name
+        event = FileCreatedEvent(str(path).encode() if as_bytes else str(path))
+        event.is_directory = is_directory
         handler.on_created(event)
 
-        drained = watcher.drain_paths()
-        assert not drained
+        assert watcher.drain_paths() == ({path} if enqueued else set())
 
-    def test_on_moved_enqueues_dest_path(
+    def test_on_created_undecodable_bytes_path(
         self, watcher: FileWatcher, logger: logging.Logger, tmp_path: Path
     ) -> None:
-        """Test that a moved file's destination path is enqueued."""
+        """Test that a non-UTF-8 bytes path is enqueued instead of raising in the observer thread."""
         handler = ConflictEventHandler(watcher, logger)
 
-        src = tmp_path / "temp.txt"
-        dest = tmp_path / "document 2.txt"
-        event = FileMovedEvent(str(src), str(dest))
-        handler.on_moved(event)
+        raw = os.fsencode(tmp_path) + b"/caf\xe9 2.txt"
+        handler.on_created(FileCreatedEvent(raw))
 
-        drained = watcher.drain_paths()
-        assert dest in drained
+        assert watcher.drain_paths() == {Path(os.fsdecode(raw))}
 
-    def test_on_moved_ignores_directory_events(
-        self, watcher: FileWatcher, logger: logging.Logger, tmp_path: Path
+    @pytest.mark.parametrize(
+        "is_directory,enqueued",
+        [
+            (False, True),  # the destination of a file move is enqueued
+            (True, False),  # directory moves are ignored
+        ],
+    )
+    def test_on_moved(
+        self,
+        watcher: FileWatcher,
+        logger: logging.Logger,
+        tmp_path: Path,
+        is_directory: bool,
+        enqueued: bool,
     ) -> None:
-        """Test that directory move events are ignored."""
+        """Test which moved paths the handler enqueues."""
         handler = ConflictEventHandler(watcher, logger)
 
-        src_dir = tmp_path / "old"
-        dest_dir = tmp_path / "new 2"
-        event = FileMovedEvent(str(src_dir), str(dest_dir))
-        event.is_directory = True
+        src = tmp_path / "temp"
+        dest = tmp_path / "document 2"
+        event = FileMovedEvent(str(src), str(dest))
+        event.is_directory = is_directory
         handler.on_moved(event)
 
-        drained = watcher.drain_paths()
-        assert not drained
-
-    def test_handles_bytes_path(self, watcher: FileWatcher, logger: logging.Logger, tmp_path: Path) -> None:
-        """Test the handling of bytes paths (some FSEvents return bytes)."""
-        handler = ConflictEventHandler(watcher, logger)
-
-        file_path = tmp_path / "document 2.txt"
-        event = FileCreatedEvent(str(file_path).encode())
-        handler.on_created(event)
-
-        drained = watcher.drain_paths()
-        assert file_path in drained
+        assert watcher.drain_paths() == ({dest} if enqueued else set())
 
 
 class TestFileWatcher:
@@ -159,12 +150,10 @@ class TestFileWatcher:
         config.watch_directories = [dir1, dir2]
         test_watcher = FileWatcher(config, logger)
 
-        with patch("icloud_cleanup.watcher.Observer") as mock_observer_class:
+        with patch("watchdog.observers.Observer") as mock_observer_class:
             self._start_and_verify_schedule_count(mock_observer_class, test_watcher, 2)
 
-    def test_skips_nonexistent_directories(
-        self, config: CleanupConfig, logger: logging.Logger, tmp_path: Path
-    ) -> None:
+    def test_skips_nonexistent_directories(self, config: CleanupConfig, logger: logging.Logger, tmp_path: Path) -> None:
         """Test that nonexistent directories are skipped."""
         existing_dir = tmp_path / "exists"
         existing_dir.mkdir()
@@ -173,7 +162,7 @@ class TestFileWatcher:
         config.watch_directories = [existing_dir, nonexistent_dir]
         test_watcher = FileWatcher(config, logger)
 
-        with patch("icloud_cleanup.watcher.Observer") as mock_observer_class:
+        with patch("watchdog.observers.Observer") as mock_observer_class:
             self._start_and_verify_schedule_count(mock_observer_class, test_watcher, 1)
 
     @staticmethod